@@ -0,0 +1,77 @@
+"""
+Compares the spelling correction backends on workloads of different word lengths
+and misspelling rates.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.bench_correction
+"""
+
+import random
+import string
+import time
+
+from src.core import CORRECTION_BACKENDS
+from src.dictionary import load_spellchecker
+
+DOCUMENT_WORDS = 100
+MISSPELLING_RATES = (0.05, 0.25)
+WORD_LENGTHS = ((4, 7), (8, 11), (12, 16))
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Applies one or two random deletes, inserts, substitutions or transpositions."""
+    for _ in range(rng.choice((1, 2))):
+        i = rng.randrange(len(word))
+        edit = rng.randrange(4)
+        if edit == 0:
+            word = word[:i] + word[i + 1 :]
+        elif edit == 1:
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+        elif edit == 2:
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1 :]
+        elif i < len(word) - 1:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    return word
+
+
+def timed(backend, words: list[str]) -> tuple[float, dict[str, str | None]]:
+    """Returns the seconds taken to correct a document's words, and the corrections."""
+    start = time.perf_counter()
+    corrections = {word: backend.correction(word) for word in backend.unknown(words)}
+    return time.perf_counter() - start, corrections
+
+
+def main() -> None:
+    spell = load_spellchecker()
+    backends = {}
+    for name, factory in CORRECTION_BACKENDS.items():
+        start = time.perf_counter()
+        backends[name] = factory(spell)
+        print(f"{name} ready in {time.perf_counter() - start:.2f}s")
+
+    frequencies = spell.word_frequency.dictionary
+    common = sorted(frequencies, key=frequencies.__getitem__, reverse=True)[:20_000]
+    rng = random.Random(0)
+    for low, high in WORD_LENGTHS:
+        words = [word for word in common if low <= len(word) <= high]
+        for rate in MISSPELLING_RATES:
+            document = [
+                misspell(word, rng) if rng.random() < rate else word
+                for word in rng.choices(words, k=DOCUMENT_WORDS)
+            ]
+            print(f"{low:>2}-{high:<2} letters, {rate:.0%} misspelled:")
+            results = {
+                name: timed(backend, document) for name, backend in backends.items()
+            }
+            baseline, expected = results["pyspellchecker"]
+            for name, (seconds, actual) in results.items():
+                agreed = sum(actual[word] == expected[word] for word in expected)
+                print(
+                    f"  {name:<15} {seconds:7.3f}s ({baseline / seconds:5.1f}x), "
+                    f"{agreed}/{len(expected)} identical"
+                )
+
+
+if __name__ == "__main__":
+    main()
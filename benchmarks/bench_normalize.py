@@ -0,0 +1,61 @@
+"""
+Compares normalize_whitespace against the original ASCII-only, three-regex
+implementation.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.bench_normalize
+"""
+
+import re
+import timeit
+
+from src.core import normalize_whitespace
+from src.pipeline import DEFAULT_PIPELINE, LINE_CACHE_SIZE
+
+WHITESPACE_PATTERN = re.compile(r" +")
+QUOTES_PATTERN = re.compile(r"[\"`´]")
+TAB_PATTERN = re.compile(r"\t")
+
+ASCII_LINE = '  The student   will\tread a "grade-level" `passage` aloud.   \n'
+WORD_LINE = "  The student will read a “grade-level” " "‘passage’​ aloud.  \n"
+
+
+def three_regex_normalize(text: str) -> str:
+    """The original per-line implementation, which only handles ASCII spaces."""
+    return "\n".join(
+        TAB_PATTERN.sub(
+            ", ", QUOTES_PATTERN.sub("'", WHITESPACE_PATTERN.sub(" ", line.strip()))
+        )
+        for line in text.splitlines()
+    )
+
+
+def best_time(function, text: str, number: int = 5, repeat: int = 5) -> float:
+    """Returns the best time in seconds for `number` calls of `function(text)`."""
+    return min(timeit.repeat(lambda: function(text), number=number, repeat=repeat))
+
+
+def report(name: str, text: str) -> None:
+    """Prints the timings of both implementations on `text`."""
+    baseline = best_time(three_regex_normalize, text)
+    current = best_time(normalize_whitespace, text)
+    print(
+        f"{name:>10} ({len(text) / 1e6:.1f}M chars): "
+        f"three regexes {baseline:.3f}s, "
+        f"normalize_whitespace {current:.3f}s ({baseline / current:.2f}x)"
+    )
+
+
+def main() -> None:
+    # Number every line so the line cache cannot help, then measure it separately
+    DEFAULT_PIPELINE.configure_cache(0)
+    for name, line in [("ASCII", ASCII_LINE), ("Word/PDF", WORD_LINE)]:
+        report(name, "".join(f"{i} {line}" for i in range(50_000)))
+
+    DEFAULT_PIPELINE.configure_cache(LINE_CACHE_SIZE)
+    report("Templated", "".join(f"{i % 100} {ASCII_LINE}" for i in range(50_000)))
+
+
+if __name__ == "__main__":
+    main()
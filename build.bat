@@ -7,12 +7,16 @@ call poetry install
 REM Create icon
 call create_icon.bat
 
+REM Precompile the spell checker dictionary for faster startup
+call poetry run python -m src.dictionary
+
 REM Build the executable directly with a single command
 call poetry run pyinstaller ^
 --name "Whitespace Normalizer" ^
 --icon=app_icon.ico ^
 --windowed ^
 --add-data "LICENSE;." ^
+--add-data "src\data;src\data" ^
 --hidden-import=pyspellchecker ^
 --version-file=file_version_info.txt ^
 --clean ^
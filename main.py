@@ -1,11 +1,25 @@
+import os
 import tkinter as tk
 
+from src.core import (
+    CORRECTION_ENGINE_VARIABLE,
+    correction_engine,
+    enable_persistent_cache,
+    set_correction_engine,
+)
 from src.gui import WhitespaceNormalizerApp, logger
 
 
 def main():
     """Creates and runs the application."""
     logger.info("Starting WhitespaceNormalizer application")
+    engine = os.environ.get(CORRECTION_ENGINE_VARIABLE)
+    if engine:
+        try:
+            set_correction_engine(engine)
+        except ValueError as e:
+            logger.warning(f"{e}; using {correction_engine}")
+    enable_persistent_cache()
     try:
         root = tk.Tk()
         app = WhitespaceNormalizerApp(root)
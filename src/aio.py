@@ -0,0 +1,151 @@
+"""
+Asyncio wrappers that normalize and autocorrect without blocking the event loop.
+"""
+
+import asyncio
+import atexit
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from src import core
+from src.correction import DEFAULT_STRATEGY, CorrectionStrategy
+from src.lexicon import DEFAULT_LEXICON, Lexicon
+from src.log import get_logger
+from src.pipeline import DEFAULT_PIPELINE, NormalizationPipeline
+from src.skip import DEFAULT_CLASSIFIER, SkipClassifier
+
+logger = get_logger()
+
+# Number of lines processed between returns to the event loop
+ASYNC_CHUNK_LINES = 500
+
+# A single thread runs every chunk, so the module-level caches are never used from
+# two threads at once; chunks of concurrent calls take turns
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the shared executor, starting it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="normalizer")
+    return _executor
+
+
+def shutdown_async_executor() -> None:
+    """Stop the thread started by the async wrappers, if any."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+atexit.register(shutdown_async_executor)
+
+
+async def _run_in_chunks(
+    text: str, process: Callable[[list[str]], str], chunk_lines: int
+) -> str:
+    """
+    Processes the lines of a text chunk by chunk on the shared executor.
+
+    Control returns to the event loop while each chunk runs. If the calling task is
+    cancelled, the chunk in progress is finished and discarded, and no further
+    chunks are started.
+
+    Args:
+        text (str): The text to process
+        process (Callable[[list[str]], str]): Turns a chunk of lines into the
+        result for those lines, joined by "\\n"
+        chunk_lines (int): Number of lines per chunk; must be positive
+
+    Returns:
+        str: The results of every chunk joined by "\\n"
+    """
+    if chunk_lines <= 0:
+        raise ValueError(f"chunk_lines must be positive, got {chunk_lines}")
+    lines = text.splitlines()
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    results = []
+    for start in range(0, len(lines), chunk_lines):
+        chunk = lines[start : start + chunk_lines]
+        results.append(await loop.run_in_executor(executor, process, chunk))
+    logger.debug(f"Processed {len(lines)} lines in {len(results)} chunks")
+    return "\n".join(results)
+
+
+async def normalize_async(
+    text: str,
+    pipeline: NormalizationPipeline = DEFAULT_PIPELINE,
+    chunk_lines: int = ASYNC_CHUNK_LINES,
+) -> str:
+    """
+    Normalize whitespace like normalize_whitespace, without blocking the event loop.
+
+    The call can be cancelled, or bounded with asyncio.timeout or
+    asyncio.wait_for, between chunks of lines.
+
+    Args:
+        text (str): Input text, which likely has irregular spacing or quotation marks
+        pipeline (NormalizationPipeline): The normalization rules to apply
+        chunk_lines (int): Number of lines normalized between returns to the loop
+
+    Returns:
+        str: A cleaned body of text with normalized whitespaces and quotes.
+    """
+    return await _run_in_chunks(text, pipeline.apply, chunk_lines)
+
+
+def _autocorrect_lines(
+    lines: list[str],
+    *,
+    workers: int | None,
+    strategy: CorrectionStrategy,
+    classifier: SkipClassifier,
+    lexicon: Lexicon,
+) -> str:
+    """Autocorrects a chunk of lines, keeping them one per line."""
+    text = "\n".join(lines)
+    edits = core.autocorrection_edits(text, workers, strategy, classifier, lexicon)
+    return core.apply_edits(text, edits)
+
+
+async def autocorrect_async(
+    text: str,
+    workers: int | None = 1,
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+    classifier: SkipClassifier = DEFAULT_CLASSIFIER,
+    lexicon: Lexicon = DEFAULT_LEXICON,
+    chunk_lines: int = ASYNC_CHUNK_LINES,
+) -> str:
+    """
+    Autocorrect like autocorrect_text, without blocking the event loop.
+
+    The call can be cancelled, or bounded with asyncio.timeout or
+    asyncio.wait_for, between chunks of lines. The strategy's document budget
+    applies to each chunk.
+
+    Args:
+        text (str): The input text to correct
+        workers (int | None): Number of processes correcting unknown words, as for
+        correct_words
+        strategy (CorrectionStrategy): Limits on the search for each correction,
+        such as LOW_LATENCY_STRATEGY
+        classifier (SkipClassifier): Picks out words never sent to the spell
+        checker, such as numbers, dates and URLs, and counts them
+        lexicon (Lexicon): Domain terms left unchanged, checked before anything else
+        chunk_lines (int): Number of lines corrected between returns to the loop
+
+    Returns:
+        str: The corrected text with paragraphs preserved
+    """
+    process = partial(
+        _autocorrect_lines,
+        workers=workers,
+        strategy=strategy,
+        classifier=classifier,
+        lexicon=lexicon,
+    )
+    return await _run_in_chunks(text, process, chunk_lines)
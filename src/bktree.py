@@ -0,0 +1,195 @@
+"""
+A BK-tree spelling correction engine, kept on disk between sessions.
+"""
+
+import marshal
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import spellchecker
+from spellchecker import SpellChecker
+
+from src.cache import app_data_dir
+from src.correction import DictionaryIndex, _should_check, damerau_levenshtein
+from src.log import get_logger
+
+logger = get_logger()
+
+# Identifies the tree layout; bump it whenever the layout changes
+BKTREE_FORMAT = 1
+_BKTREE_MAGIC = "whitespace-normalizer-bktree"
+
+
+def default_bktree_path() -> Path:
+    """
+    Return where the BK-tree is saved by default.
+
+    Returns:
+        Path: The tree file in the user's app data directory
+    """
+    return app_data_dir() / "bktree.marshal"
+
+
+def _fingerprint(frequencies: Mapping[str, int]) -> tuple[str, int, int, int]:
+    """Identifies a dictionary well enough to tell when a saved tree is stale."""
+    return (
+        _BKTREE_MAGIC,
+        BKTREE_FORMAT,
+        len(frequencies),
+        sum(frequencies.values()),
+    )
+
+
+class BKTree(DictionaryIndex):
+    """
+    A Burkhard-Keller tree over a word-frequency dictionary.
+
+    Each node's children are keyed by their Damerau-Levenshtein distance to it.
+    Since the distance is a metric, a word within `max_distance` of the one being
+    corrected can only lie under children whose key is within `max_distance` of
+    that word's distance to the node, so most of the tree is never visited. The
+    tolerance shrinks to the best distance found so far.
+    """
+
+    def __init__(
+        self,
+        frequencies: Mapping[str, int],
+        max_distance: int = 2,
+        nodes: tuple[list[str], list[dict[int, int] | None]] | None = None,
+    ) -> None:
+        """
+        Build the tree, or adopt one built earlier.
+
+        Args:
+            frequencies (Mapping[str, int]): Lowercase dictionary words and their
+            frequencies
+            max_distance (int): The largest edit distance at which to look for
+            corrections
+            nodes (tuple[list[str], list[dict[int, int] | None]] | None): The words
+            of a tree built over the same dictionary, and the children of each
+            node; built from the dictionary if omitted
+        """
+        super().__init__(frequencies, max_distance)
+        if nodes is None:
+            nodes = self._build(frequencies)
+        self._words, self._children = nodes
+        logger.debug(f"BK-tree ready: {len(self._words)} words")
+
+    @staticmethod
+    def _build(
+        frequencies: Mapping[str, int],
+    ) -> tuple[list[str], list[dict[int, int] | None]]:
+        """Inserts every word, most frequent first, into a new tree."""
+        words = sorted(frequencies, key=lambda word: (-frequencies[word], word))
+        children: list[dict[int, int] | None] = [None] * len(words)
+        for index in range(1, len(words)):
+            word = words[index]
+            node = 0
+            while True:
+                distance = damerau_levenshtein(word, words[node])
+                branches = children[node]
+                if branches is None:
+                    children[node] = {distance: index}
+                    break
+                child = branches.get(distance)
+                if child is None:
+                    branches[distance] = index
+                    break
+                node = child
+        return words, children
+
+    @classmethod
+    def from_spellchecker(
+        cls,
+        checker: SpellChecker,
+        path: str | Path | None = None,
+        **kwargs: Any,
+    ) -> "BKTree":
+        """
+        Load the tree for a SpellChecker's dictionary, building and saving it if needed.
+
+        A saved tree is rebuilt if it is missing, corrupt, or was built over a
+        different dictionary.
+
+        Args:
+            checker (SpellChecker): The checker whose dictionary to index
+            path (str | Path | None): Where the tree is saved; defaults to
+            default_bktree_path()
+            **kwargs: Passed on to the BKTree constructor
+
+        Returns:
+            BKTree: The tree, using the checker's edit distance by default
+        """
+        kwargs.setdefault("max_distance", checker.distance)
+        frequencies = checker.word_frequency.dictionary
+        path = Path(path) if path else default_bktree_path()
+        expected = (*_fingerprint(frequencies), spellchecker.__version__)
+        try:
+            header, words, children = marshal.loads(path.read_bytes())
+            if tuple(header) != expected or len(words) != len(children):
+                raise ValueError(f"BK-tree header {header!r} does not match")
+        except FileNotFoundError:
+            logger.info(f"No BK-tree at {path}, building one")
+        except (EOFError, TypeError, ValueError) as e:
+            logger.warning(f"Rebuilding unusable BK-tree {path}: {e}")
+        else:
+            return cls(frequencies, nodes=(words, children), **kwargs)
+
+        tree = cls(frequencies, **kwargs)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(marshal.dumps((expected, tree._words, tree._children)))
+        except OSError as e:
+            logger.warning(f"Could not save BK-tree to {path}: {e}")
+        else:
+            logger.info(f"Saved BK-tree of {len(tree._words)} words to {path}")
+        return tree
+
+    def candidates(self, word: str, max_distance: int | None = None) -> set[str] | None:
+        """
+        Find the closest dictionary words to a word.
+
+        Args:
+            word (str): The word for which to find corrections
+            max_distance (int | None): Search only up to this edit distance;
+            defaults to the tree's
+
+        Returns:
+            set[str] | None: The word itself if it is known or should not be checked,
+            the dictionary words at the smallest edit distance up to max_distance,
+            or None if there are none
+        """
+        lowered = word.lower()
+        if lowered in self.frequencies or not _should_check(
+            lowered, self.longest_word_length
+        ):
+            return {word}
+        if not self._words:
+            return None
+
+        best_distance = self.max_distance if max_distance is None else max_distance
+        best: set[str] = set()
+        words, children = self._words, self._children
+        pending = [0]
+        while pending:
+            node = pending.pop()
+            distance = damerau_levenshtein(lowered, words[node])
+            if distance <= best_distance:
+                if distance < best_distance:
+                    best_distance = distance
+                    best.clear()
+                best.add(words[node])
+            branches = children[node]
+            if branches is not None:
+                # Branches nearest the word's distance are searched first, since
+                # they are the likeliest to tighten the tolerance
+                for offset in range(best_distance, 0, -1):
+                    for key in (distance + offset, distance - offset):
+                        child = branches.get(key)
+                        if child is not None:
+                            pending.append(child)
+                child = branches.get(distance)
+                if child is not None:
+                    pending.append(child)
+        return best or None
@@ -0,0 +1,267 @@
+"""
+Bounded in-memory caches with hit and miss statistics, and a persistent cache on disk.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+from typing import Generic, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Number of new entries a PersistentCache holds in memory before writing them out
+PERSISTENT_BATCH_SIZE = 256
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the style of functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    maxbytes: int | None = None
+    currbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _entry_size(key: object, value: object) -> int:
+    """Approximates the memory held by one cache entry, in bytes."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping that keeps at most `maxsize` entries, evicting the least recently used.
+
+    The cache can also be bounded by the approximate memory its keys and values
+    hold, as measured by sys.getsizeof.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries; must be positive
+            maxbytes (int | None): Maximum approximate size of the keys and values
+            in bytes, or None for no limit
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: K) -> V | None:
+        """Returns the cached value for `key`, or None, and counts the lookup."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return value
+
+    def get_many(self, keys: list[K]) -> list[V | None]:
+        """Looks up several keys at once; missing keys map to None."""
+        data = self._data
+        values = list(map(data.get, keys))
+        misses = values.count(None)
+        self.misses += misses
+        self.hits += len(values) - misses
+        if misses < len(values):
+            for key, value in zip(keys, values, strict=True):
+                if value is not None:
+                    data.move_to_end(key)
+        return values
+
+    def put(self, key: K, value: V) -> None:
+        """Stores a value, evicting the least recently used entries if full."""
+        self.update([(key, value)])
+
+    def update(self, items: Iterable[tuple[K, V]]) -> None:
+        """Stores several values, then evicts down to the cache's bounds."""
+        data = self._data
+        tracked = self.maxbytes is not None
+        for key, value in items:
+            if tracked:
+                if key in data:
+                    self._bytes -= _entry_size(key, data[key])
+                self._bytes += _entry_size(key, value)
+            data[key] = value
+            data.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache is within bounds."""
+        data = self._data
+        for _ in range(len(data) - self.maxsize):
+            self._pop_oldest()
+        if self.maxbytes is not None:
+            while self._bytes > self.maxbytes and data:
+                self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        """Removes the least recently used entry."""
+        key, value = self._data.popitem(last=False)
+        if self.maxbytes is not None:
+            self._bytes -= _entry_size(key, value)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics."""
+        self._data.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the current cache statistics."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._data),
+            self.maxbytes,
+            self._bytes,
+        )
+
+
+def app_data_dir() -> Path:
+    """
+    Return the application's directory for per-user data.
+
+    Returns:
+        Path: A "whitespace-normalizer" directory in %LOCALAPPDATA% on Windows,
+        otherwise in $XDG_CACHE_HOME or ~/.cache
+    """
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "whitespace-normalizer"
+
+
+def default_cache_path() -> Path:
+    """
+    Return the location of the persistent cache in the user's app data directory.
+
+    Returns:
+        Path: The corrections database in app_data_dir()
+    """
+    return app_data_dir() / "corrections.sqlite3"
+
+
+class PersistentCache:
+    """
+    A string-to-string mapping kept in an SQLite database across sessions.
+
+    Entries belong to a namespace, so that values computed under different settings
+    never mix. The database is only opened on the first lookup, which then loads the
+    whole namespace into memory. New entries are written back in batches of
+    `batch_size`, and on flush() or close().
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        namespace: str,
+        batch_size: int = PERSISTENT_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the cache without touching the disk.
+
+        Args:
+            path (str | Path): Location of the SQLite database, created if missing
+            namespace (str): Identifies the settings the cached values depend on
+            batch_size (int): Number of new entries buffered before writing them out
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.batch_size = batch_size
+        self._entries: dict[str, str] | None = None
+        self._pending: dict[str, str] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database, again in a child process that inherited this cache."""
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT, key TEXT, value TEXT, PRIMARY KEY (namespace, key)"
+                ") WITHOUT ROWID"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+    def _load(self) -> dict[str, str]:
+        """Reads the namespace into memory on first use."""
+        if self._entries is None:
+            rows = self._connect().execute(
+                "SELECT key, value FROM entries WHERE namespace = ?",
+                (self.namespace,),
+            )
+            self._entries = dict(rows)
+        return self._entries
+
+    def get(self, key: str) -> str | None:
+        """Returns the value stored for a key, or None if there is none."""
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, value: str) -> None:
+        """Stores a value, writing out the pending batch once it is full."""
+        with self._lock:
+            self._load()[key] = value
+            self._pending[key] = value
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self) -> None:
+        """Writes every pending entry to the database."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Writes the pending entries; the caller must hold the lock."""
+        if not self._pending:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                [(self.namespace, key, value) for key, value in self._pending.items()],
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Writes pending entries and closes the database; it reopens on next use."""
+        with self._lock:
+            self._flush()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
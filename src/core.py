@@ -3,105 +3,938 @@ A whitespace normalizing application for
 normalizing whitespaces, which can optionally autocorrect spelling errors in the text.
 """
 
+import atexit
+import codecs
+import mmap
+import os
 import re
-from functools import lru_cache
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Literal, TextIO, cast, overload
 
+import spellchecker
 from spellchecker import SpellChecker
 
+from src.bktree import BKTree
+from src.cache import LRUCache, PersistentCache, default_cache_path
+from src.correction import (
+    DEFAULT_STRATEGY,
+    CorrectionBackend,
+    CorrectionStrategy,
+    SpellCheckerBackend,
+    SymSpellIndex,
+    tiered_correction,
+)
+from src.dictionary import load_spellchecker
+from src.lexicon import DEFAULT_LEXICON, Lexicon
 from src.log import get_logger
+from src.pipeline import (
+    DEFAULT_PIPELINE,
+    FOLD_QUOTES,
+    MAP_TABS,
+    NormalizationPipeline,
+)
+from src.skip import DEFAULT_CLASSIFIER, SkipClassifier
 
 logger = get_logger()
-spell = SpellChecker()
-logger.debug("SpellChecker initialized")
+
+# Dictionary settings of the shared SpellChecker, which is only loaded on first use
+SPELL_LANGUAGE = "en"
+SPELL_DISTANCE = 2
+_spell: SpellChecker | None = None
+_spell_lock = threading.Lock()
 
 # Global pre-compiled regex patterns
 WHITESPACE_PATTERN = re.compile(r" +")
 QUOTES_PATTERN = re.compile(r"[\"`´]")
 TAB_PATTERN = re.compile(r"\t")
 
+# Byte-level equivalents of the default rules, valid for ASCII input only
+# The ASCII pattern of COLLAPSE_SPACES, as bytes
+BYTES_WHITESPACE_PATTERN = re.compile(rb"  +")
+_ASCII_QUOTES = bytes(ord(char) for char in FOLD_QUOTES.characters if char.isascii())
+BYTES_QUOTES_TABLE = bytes.maketrans(
+    _ASCII_QUOTES, FOLD_QUOTES.replacement.encode() * len(_ASCII_QUOTES)
+)
+# ASCII characters that str.splitlines() or str.strip() handle but bytes do not
+BYTES_UNSUPPORTED_PATTERN = re.compile(rb"[\x0b\x0c\x1c-\x1f]")
+
+# Characters str.splitlines() treats as line boundaries
+LINE_BOUNDARIES = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+# Number of characters buffered by normalize_stream before normalizing a batch
+STREAM_BATCH_SIZE = 1 << 16
+
+# Size in bytes of the newline-aligned windows normalize_file reads at a time
+MMAP_WINDOW_SIZE = 1 << 22
+# Size in bytes of the write buffer used by normalize_file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Texts shorter than this many characters are never normalized in parallel
+PARALLEL_THRESHOLD = 1 << 20
+
+# Number of documents sent to a worker process per task by normalize_many
+DOCUMENT_CHUNK_SIZE = 64
+
+# Bounds of the word-level correction cache, in entries and approximate bytes
+CORRECTION_CACHE_SIZE = 50_000
+CORRECTION_CACHE_BYTES = 16 << 20
+
+# Fewer unknown words than this are always corrected in the calling process
+PARALLEL_CORRECTION_THRESHOLD = 16
+
+# Maps each word looked up so far to its correction, or to itself if it has none
+correction_cache: LRUCache[str, str] = LRUCache(
+    CORRECTION_CACHE_SIZE, maxbytes=CORRECTION_CACHE_BYTES
+)
+
+# Punctuation kept in place around the words autocorrect_text corrects
+PUNCTUATION = ".,:;!?()[]{}\"'"
+_PUNCTUATION_CLASS = re.escape(PUNCTUATION)
+# A token is leading punctuation, a word, trailing punctuation and whitespace.
+# Punctuation inside the word, as in "don't", only belongs to it when a word
+# character follows, which keeps the match linear in the length of the token.
+TOKEN_PATTERN = re.compile(
+    rf"(?P<prefix>[{_PUNCTUATION_CLASS}]*)"
+    rf"(?P<core>(?:[^\s{_PUNCTUATION_CLASS}]+"
+    rf"|[{_PUNCTUATION_CLASS}]+(?=[^\s{_PUNCTUATION_CLASS}]))*)"
+    rf"(?P<suffix>[{_PUNCTUATION_CLASS}]*)"
+    r"(?P<separator>\s*)"
+)
+
+
+def _vectorized_backend(checker: SpellChecker) -> CorrectionBackend:
+    """Builds the NumPy engine, only importing NumPy once it is selected."""
+    from src.vectorized import VectorizedIndex
+
+    return VectorizedIndex.from_spellchecker(checker)
+
+
+# Spelling correction engines autocorrect_text can use, each built from the shared
+# SpellChecker by its factory when first needed. More engines can be registered.
+CORRECTION_BACKENDS: dict[str, Callable[[SpellChecker], CorrectionBackend]] = {
+    "pyspellchecker": SpellCheckerBackend,
+    "symspell": SymSpellIndex.from_spellchecker,
+    "numpy": _vectorized_backend,
+    "bktree": BKTree.from_spellchecker,
+}
+# Environment variable naming the engine the application starts with
+CORRECTION_ENGINE_VARIABLE = "WHITESPACE_NORMALIZER_ENGINE"
+correction_engine = "pyspellchecker"
+# Backends built so far, by engine name; pyspellchecker's wraps the shared checker
+_backends: dict[str, CorrectionBackend] = {}
+_backend_lock = threading.Lock()
+
+# Worker processes with the dictionary loaded, kept between calls to correct_words
+_correction_executor: ProcessPoolExecutor | None = None
+_correction_executor_key: tuple[int | None, str] | None = None
+
+# Corrections shared across sessions, checked after correction_cache; off by default
+persistent_cache: PersistentCache | None = None
+
+# Counts changes of the engine or persistent cache, see correction_generation
+_settings_generation = 0
 
-def normalize_whitespace(text: str) -> str:
+
+def normalize_whitespace(
+    text: str, pipeline: NormalizationPipeline = DEFAULT_PIPELINE
+) -> str:
     """
     Splits the text into lines, strips all trailing whitespace, regularizes all quote glyphs, and rejoins it.
 
     Args:
         text (str): Input text, which likely has irregular spacing or quotation marks
+        pipeline (NormalizationPipeline): The normalization rules to apply
 
     Returns:
         str: A cleaned body of text with normalized whitespaces and quotes.
     """
     logger.debug(f"Normalizing whitespace for text of length {len(text)}")
 
-    # Process all operations in a single pass
-    normalized_lines = [
-        TAB_PATTERN.sub(
-            ", ", QUOTES_PATTERN.sub("'", WHITESPACE_PATTERN.sub(" ", line.strip()))
-        )
-        for line in text.splitlines()
-    ]
+    lines = text.splitlines()
+    normalized = pipeline.apply(lines)
 
-    logger.debug(
-        f"Whitespace normalization complete, result length: {len(normalized_lines)}"
+    logger.debug(f"Whitespace normalization complete, result length: {len(lines)}")
+    return normalized
+
+
+def _is_plain_ascii(data: bytes | bytearray) -> bool:
+    """Whether normalize_bytes can normalize `data` without decoding it."""
+    return data.isascii() and BYTES_UNSUPPORTED_PATTERN.search(data) is None
+
+
+def normalize_bytes(data: bytes | bytearray) -> bytes:
+    """
+    Normalizes UTF-8 encoded text without decoding it when it is plain ASCII.
+
+    ASCII input is normalized directly with bytes methods, a bytes regex and a bytes
+    translation table, skipping the decode and encode round-trip. Anything else is
+    decoded as UTF-8 and normalized with normalize_whitespace. Both paths give the
+    same result.
+
+    Args:
+        data (bytes | bytearray): UTF-8 encoded input text
+
+    Returns:
+        bytes: The normalized text, encoded as UTF-8.
+    """
+    if not _is_plain_ascii(data):
+        return DEFAULT_PIPELINE.apply(bytes(data).decode().splitlines()).encode()
+
+    stripped = b"\n".join([line.strip() for line in data.splitlines()])
+    return (
+        BYTES_WHITESPACE_PATTERN.sub(b" ", stripped)
+        .translate(BYTES_QUOTES_TABLE)
+        .replace(MAP_TABS.characters.encode(), MAP_TABS.replacement.encode())
     )
-    return "\n".join(normalized_lines)
 
 
-@lru_cache(maxsize=10000)
-def autocorrect_text(text: str) -> str:
+def _normalize_block(block: str) -> str:
+    """Normalizes one line-aligned block of a larger text in a worker process."""
+    return DEFAULT_PIPELINE.apply(block.splitlines())
+
+
+def _line_aligned_bounds(
+    find_newline: Callable[[int], int], size: int, window_size: int
+) -> Iterator[tuple[int, int]]:
     """
-    Autocorrect misspelled words in a text using pyspellchecker while preserving paragraphs.
+    Divides text or bytes into windows that end just after a newline.
 
     Args:
-        text (str): The input text to correct
+        find_newline (Callable[[int], int]): Returns the index of the first newline
+        at or after an index, or -1 if there is none
+        size (int): Length of the text or bytes
+        window_size (int): Minimum size of each window; a window only stops short
+        of this at the end
+
+    Yields:
+        tuple[int, int]: The start and end of each consecutive window.
+    """
+    start = 0
+    while start < size:
+        end = size
+        if start + window_size < size:
+            newline = find_newline(start + window_size - 1)
+            if newline != -1:
+                end = newline + 1
+        yield start, end
+        start = end
+
+
+def _split_blocks(text: str, block_size: int) -> Iterator[str]:
+    """Splits text into blocks of at least block_size characters ending in "\n"."""
+    bounds = _line_aligned_bounds(partial(text.find, "\n"), len(text), block_size)
+    return (text[start:end] for start, end in bounds)
+
+
+def normalize_parallel(
+    text: str,
+    workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    block_size: int | None = None,
+) -> str:
+    """
+    Normalizes a large text across a pool of worker processes.
+
+    The text is split into line-aligned blocks that are normalized independently and
+    reassembled in order, so the result is identical to normalize_whitespace. Texts
+    shorter than `threshold` characters, or runs with a single worker, stay serial.
+
+    Args:
+        text (str): Input text, which likely has irregular spacing or quotation marks
+        workers (int | None): Number of worker processes; defaults to the CPU count
+        threshold (int): Minimum text length in characters for parallel processing
+        block_size (int | None): Approximate block size in characters; defaults to
+        four blocks per worker
 
     Returns:
-        str: The corrected text with paragraphs preserved
+        str: A cleaned body of text with normalized whitespaces and quotes.
     """
-    # Split the text into lines to preserve structure
-    lines = text.splitlines()
+    workers = workers or os.cpu_count() or 1
+    if len(text) < threshold or workers == 1:
+        return normalize_whitespace(text)
 
-    corrected_lines = []
+    block_size = block_size or -(-len(text) // (workers * 4))
+    logger.debug(
+        f"Normalizing text of length {len(text)} with {workers} workers "
+        f"in blocks of {block_size} characters"
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        blocks = executor.map(_normalize_block, _split_blocks(text, block_size))
+        return "\n".join(blocks)
+
+
+def _normalize_chunks(
+    source: Iterable[str], batch_size: int = STREAM_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Normalizes arbitrary text chunks in batches of complete lines.
 
-    for line in lines:
-        # Skip empty lines but preserve them in the output
-        if not line.strip():
-            corrected_lines.append("")
+    Partial lines are carried over to the next chunk, so the input does not have to
+    be split on line boundaries.
+
+    Args:
+        source (Iterable[str]): Chunks of text, e.g. an open text file
+        batch_size (int): Approximate number of characters normalized at once
+
+    Yields:
+        str: Normalized batches of one or more lines joined by "\\n".
+    """
+    # The unterminated last line, in the parts it arrived in; it never contains a
+    # line boundary, except a final carriage return, so only new chunks are searched
+    pending: list[str] = []
+    batch: list[str] = []
+    buffered = 0
+
+    for chunk in source:
+        if not chunk:
+            continue
+        if chunk[-1] == "\n":
+            cut = len(chunk)
+        else:
+            # Hold back an unterminated last line, and a trailing carriage return
+            # that may be the first half of a CRLF split across two chunks.
+            end = len(chunk) - 1 if chunk[-1] == "\r" else len(chunk)
+            cut = max(chunk.rfind(boundary, 0, end) for boundary in LINE_BOUNDARIES)
+            cut += 1
+        # A held back carriage return ends a line unless the chunk continues a CRLF
+        held_line = bool(pending) and pending[-1][-1] == "\r" and chunk[0] != "\n"
+        if not cut and not held_line:
+            pending.append(chunk)
             continue
+        text = "".join(pending) + chunk[:cut]
+        pending = [chunk[cut:]] if cut < len(chunk) else []
 
-        # Split the line into words
-        words = line.split()
+        batch.append(text)
+        buffered += len(text)
+        if buffered >= batch_size:
+            yield DEFAULT_PIPELINE.apply("".join(batch).splitlines())
+            batch.clear()
+            buffered = 0
 
-        # Corrected words list
-        corrected_words = []
+    if pending:
+        batch.append("".join(pending))
+    if batch:
+        yield DEFAULT_PIPELINE.apply("".join(batch).splitlines())
 
-        for word in words:
-            # Preserve punctuation
-            word, punctuation = preserve_punctuation(word)
 
-            # Skip correction for capitalized words (likely proper nouns)
-            if word and word[0].isupper():
-                corrected_words.append(word + punctuation)
-                continue
+def normalize_stream(
+    source: Iterable[str], batch_size: int = STREAM_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Lazily normalizes a stream of text, yielding one normalized line at a time.
+
+    Only about `batch_size` characters are held in memory at once, so this works on
+    inputs larger than RAM. Joining the yielded lines with "\\n" gives the same
+    result as calling normalize_whitespace on the whole text.
+
+    Args:
+        source (Iterable[str]): An open text file, a line iterator, or any iterable
+        of text chunks
+        batch_size (int): Approximate number of characters normalized at once
+
+    Yields:
+        str: Normalized lines, without line terminators.
+    """
+    for normalized in _normalize_chunks(source, batch_size):
+        yield from normalized.split("\n")
+
+
+def write_normalized_stream(
+    source: Iterable[str], output: TextIO, batch_size: int = STREAM_BATCH_SIZE
+) -> int:
+    """
+    Normalizes a stream of text and writes it straight to an output file handle.
+
+    Args:
+        source (Iterable[str]): An open text file, a line iterator, or any iterable
+        of text chunks
+        output (TextIO): A writable text file handle
+        batch_size (int): Approximate number of characters normalized at once
+
+    Returns:
+        int: The number of characters written.
+    """
+    written = 0
+    separator = ""
+    for normalized in _normalize_chunks(source, batch_size):
+        written += output.write(separator)
+        written += output.write(normalized)
+        separator = "\n"
+    logger.debug(f"Stream normalization complete, {written} characters written")
+    return written
+
+
+@contextmanager
+def _mapped_windows(
+    path: str | os.PathLike[str], window_size: int = MMAP_WINDOW_SIZE
+) -> Iterator[Iterator[bytes]]:
+    """
+    Memory-maps a file and walks it in windows that end just after a newline byte.
+
+    Args:
+        path (str | os.PathLike[str]): The file to read
+        window_size (int): Minimum size of each window in bytes; a window only
+        stops short of this at the end of the file
+
+    Yields:
+        Iterator[bytes]: Consecutive slices of the file, valid until the block
+        exits; none for an empty file, which cannot be memory-mapped
+    """
+    with open(path, "rb") as source:
+        if os.fstat(source.fileno()).st_size == 0:
+            yield iter(())
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            find_newline = partial(data.find, b"\n")
+            bounds = _line_aligned_bounds(find_newline, len(data), window_size)
+            yield (data[start:end] for start, end in bounds)
+
+
+def _decode_windows(
+    windows: Iterable[bytes], encoding: str, errors: str = "strict"
+) -> Iterator[str]:
+    """
+    Incrementally decodes byte windows, carrying split characters between them.
+
+    Args:
+        windows (Iterable[bytes]): Consecutive slices of encoded text
+        encoding (str): The text encoding
+        errors (str): The codec error handler
+
+    Yields:
+        str: Decoded text for each window.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    for window in windows:
+        yield decoder.decode(window)
+    yield decoder.decode(b"", final=True)
+
+
+def normalize_file(
+    input_path: str | os.PathLike[str],
+    output_path: str | os.PathLike[str],
+    encoding: str = "utf-8",
+    window_size: int = MMAP_WINDOW_SIZE,
+) -> int:
+    """
+    Normalizes a text file into another file without loading it into memory.
+
+    The input is memory-mapped and walked in newline-aligned windows that are decoded
+    incrementally and normalized as a stream, so only about one window of text is
+    held as a Python str at any time. The output is written through a buffered
+    writer and uses "\\n" line endings.
+
+    Args:
+        input_path (str | os.PathLike[str]): The file to normalize
+        output_path (str | os.PathLike[str]): Where to write the normalized text
+        encoding (str): Encoding of both files
+        window_size (int): Approximate number of bytes read at a time
+
+    Returns:
+        int: The number of characters written.
+    """
+    logger.debug(f"Normalizing file {input_path} into {output_path}")
+
+    if codecs.lookup(encoding).name == "utf-8":
+        return _normalize_utf8_file(input_path, output_path, window_size)
+
+    with (
+        _mapped_windows(input_path, window_size) as windows,
+        open(
+            output_path,
+            "w",
+            encoding=encoding,
+            newline="",
+            buffering=OUTPUT_BUFFER_SIZE,
+        ) as output,
+    ):
+        return write_normalized_stream(_decode_windows(windows, encoding), output)
 
-            # Skip empty strings
-            if not word:
-                continue
 
-            # Get the corrected word
-            corrected = spell.correction(word)
+def _normalize_utf8_file(
+    input_path: str | os.PathLike[str],
+    output_path: str | os.PathLike[str],
+    window_size: int,
+) -> int:
+    """
+    Normalizes a UTF-8 file window by window with normalize_bytes.
+
+    Windows end just after a newline, so each one holds complete lines and complete
+    characters, and ASCII windows are never decoded.
 
-            # Add back punctuation
-            if corrected:
-                corrected_words.append(corrected + punctuation)
+    Args:
+        input_path (str | os.PathLike[str]): The file to normalize
+        output_path (str | os.PathLike[str]): Where to write the normalized text
+        window_size (int): Approximate number of bytes read at a time
+
+    Returns:
+        int: The number of characters written.
+    """
+    written = 0
+    with (
+        _mapped_windows(input_path, window_size) as windows,
+        open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as output,
+    ):
+        separator = b""
+        for window in windows:
+            if _is_plain_ascii(window):
+                normalized = normalize_bytes(window)
+                length = len(normalized)
             else:
-                corrected_words.append(word + punctuation)
+                text = DEFAULT_PIPELINE.apply(window.decode().splitlines())
+                normalized = text.encode()
+                length = len(text)
+            output.write(separator)
+            output.write(normalized)
+            written += len(separator) + length
+            separator = b"\n"
+    return written
+
+
+def get_spellchecker() -> SpellChecker:
+    """
+    Return the shared SpellChecker, loading its dictionary on first use.
 
-        # Join the corrected words back into a line
-        corrected_line = " ".join(corrected_words)
-        corrected_lines.append(corrected_line)
+    Loading the English dictionary takes a noticeable fraction of a second, so it
+    is deferred until autocorrection is first needed, and read from a dictionary
+    snapshot when one has been built. Assigning `spell` on this
+    module replaces the shared checker.
+
+    Returns:
+        SpellChecker: The shared spell checker
+    """
+    global _spell
+    override = cast(SpellChecker | None, globals().get("spell"))
+    if override is not None:
+        return override
+    if _spell is None:
+        with _spell_lock:
+            if _spell is None:
+                _spell = load_spellchecker(SPELL_LANGUAGE, SPELL_DISTANCE)
+                logger.debug("SpellChecker initialized")
+    return _spell
+
+
+def warm_up() -> threading.Thread:
+    """
+    Load the spell checker, and the selected correction engine, in the background.
+
+    Returns:
+        threading.Thread: The daemon thread doing the loading, already started
+    """
 
-    # Join the lines back together with newlines
-    return "\n".join(corrected_lines)
+    def load() -> None:
+        get_correction_backend()
+
+    thread = threading.Thread(target=load, name="spellchecker-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def __getattr__(name: str) -> SpellChecker:
+    """Exposes the lazily loaded shared SpellChecker as `spell`."""
+    if name == "spell":
+        return get_spellchecker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_correction_backend() -> CorrectionBackend:
+    """
+    Return the backend of the selected engine, building it on first use.
+
+    Returns:
+        CorrectionBackend: The engine that corrects unknown words
+    """
+    if correction_engine == "pyspellchecker":
+        # Not kept, so that replacing `spell` takes effect immediately
+        return SpellCheckerBackend(get_spellchecker())
+    engine = correction_engine
+    backend = _backends.get(engine)
+    if backend is None:
+        with _backend_lock:
+            backend = _backends.get(engine)
+            if backend is None:
+                logger.info(f"Building {engine} correction backend")
+                backend = CORRECTION_BACKENDS[engine](get_spellchecker())
+                _backends[engine] = backend
+    return backend
+
+
+def set_correction_engine(engine: str) -> None:
+    """
+    Select the engine autocorrect_text uses to correct unknown words.
+
+    "pyspellchecker" generates every edit of a word on each lookup. "symspell"
+    builds a symmetric-delete index over the same dictionary, which takes a few
+    seconds once, then finds the same corrections with hash probes. "numpy"
+    scores every dictionary word of a similar length with vectorized edit
+    distances, so its lookups take about as long for long words as for short
+    ones. "bktree" searches a metric tree that is built once, in under a minute,
+    then saved in the app data directory and loaded in a fraction of a second.
+    The selected engine is built the first time it is used, or by warm_up.
+
+    Args:
+        engine (str): A key of CORRECTION_BACKENDS
+    """
+    global correction_engine, _settings_generation
+    if engine not in CORRECTION_BACKENDS:
+        raise ValueError(
+            f"Unknown correction engine {engine!r}; "
+            f"expected one of {tuple(CORRECTION_BACKENDS)}"
+        )
+    correction_engine = engine
+    _settings_generation += 1
+    correction_cache.clear()
+    if persistent_cache is not None:
+        enable_persistent_cache(persistent_cache.path)
+
+
+def correction_generation(lexicon: Lexicon = DEFAULT_LEXICON) -> int:
+    """
+    Return a number that grows whenever autocorrect results may have changed.
+
+    It increases when the lexicon is reloaded, which this checks for first, when
+    an engine is selected and when the persistent cache is enabled. Results kept
+    from autocorrect_text are stale once it changes.
+
+    Args:
+        lexicon (Lexicon): The lexicon autocorrect runs with
+
+    Returns:
+        int: The current generation
+    """
+    lexicon.refresh()
+    return _settings_generation + lexicon.generation
+
+
+def _correction_namespace() -> str:
+    """Identifies the dictionary and engine settings corrections depend on."""
+    return (
+        f"pyspellchecker-{spellchecker.__version__}/language={SPELL_LANGUAGE}"
+        f"/distance={SPELL_DISTANCE}/engine={correction_engine}"
+    )
+
+
+def enable_persistent_cache(path: str | Path | None = None) -> PersistentCache:
+    """
+    Keep word corrections on disk so they are reused by later sessions.
+
+    Corrections are stored per dictionary version and engine settings, read on the
+    first lookup and written back in batches. Pending corrections are also written
+    when the interpreter exits.
+
+    Args:
+        path (str | Path | None): Location of the database; defaults to the user's
+        app data directory
+
+    Returns:
+        PersistentCache: The cache now consulted by correct_words, and so by
+        autocorrect_text, after the in-memory correction_cache
+    """
+    global persistent_cache, _settings_generation
+    disable_persistent_cache()
+    _settings_generation += 1
+    persistent_cache = PersistentCache(
+        path or default_cache_path(), _correction_namespace()
+    )
+    atexit.register(persistent_cache.close)
+    return persistent_cache
+
+
+def disable_persistent_cache() -> None:
+    """Write out and stop using the persistent correction cache, if enabled."""
+    global persistent_cache
+    if persistent_cache is not None:
+        persistent_cache.close()
+        atexit.unregister(persistent_cache.close)
+        persistent_cache = None
+
+
+def _init_correction_worker(engine: str) -> None:
+    """Loads the dictionary, and the engine's backend, once per worker process."""
+    if engine != correction_engine:
+        set_correction_engine(engine)
+    get_correction_backend()
+
+
+def _init_batch_worker(
+    autocorrect: bool, engine: str, cache_path: Path | None, lexicon_paths: list[Path]
+) -> None:
+    """Gives a batch worker the parent's engine, persistent cache and lexicon."""
+    if not autocorrect:
+        return
+    _init_correction_worker(engine)
+    if cache_path is None:
+        disable_persistent_cache()
+    elif persistent_cache is None or persistent_cache.path != cache_path:
+        enable_persistent_cache(cache_path)
+    DEFAULT_LEXICON.paths = lexicon_paths
+
+
+def _correct_unknown(
+    words: list[str],
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+    deadline: float | None = None,
+) -> list[str | None]:
+    """Corrects words missing from the dictionary; None marks a search cut short."""
+    backend = get_correction_backend()
+    if strategy.unlimited and deadline is None:
+        return [backend.correction(word) or word for word in words]
+    results: list[str | None] = []
+    for word in words:
+        correction, complete = tiered_correction(backend, word, strategy, deadline)
+        results.append(correction or word if complete else None)
+    return results
+
+
+def _get_correction_executor(workers: int | None) -> ProcessPoolExecutor:
+    """Returns the shared correction pool, replacing it if its settings changed."""
+    global _correction_executor, _correction_executor_key
+    key = (workers, correction_engine)
+    if _correction_executor is None or _correction_executor_key != key:
+        shutdown_correction_workers()
+        _correction_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_correction_worker,
+            initargs=(correction_engine,),
+        )
+        _correction_executor_key = key
+    return _correction_executor
+
+
+def shutdown_correction_workers() -> None:
+    """Stop the worker processes started by correct_words, if any."""
+    global _correction_executor, _correction_executor_key
+    if _correction_executor is not None:
+        _correction_executor.shutdown()
+        _correction_executor = None
+        _correction_executor_key = None
+
+
+atexit.register(shutdown_correction_workers)
+
+
+def _correct_unknown_parallel(
+    words: list[str],
+    workers: int | None,
+    strategy: CorrectionStrategy,
+    deadline: float | None,
+) -> list[str | None]:
+    """Spreads unknown words over the correction pool, preserving their order."""
+    executor = _get_correction_executor(workers)
+    chunk_count = (workers or os.cpu_count() or 1) * 4
+    chunk_size = -(-len(words) // chunk_count)
+    chunks = [words[i : i + chunk_size] for i in range(0, len(words), chunk_size)]
+    correct = partial(_correct_unknown, strategy=strategy, deadline=deadline)
+    return [word for chunk in executor.map(correct, chunks) for word in chunk]
+
+
+def correct_words(
+    words: Iterable[str],
+    workers: int | None = 1,
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+) -> dict[str, str]:
+    """
+    Return the spelling corrections of several words, resolving each one only once.
+
+    Words missing from the caches are split into known and unknown words with a
+    single call to the backend's unknown(), so only unknown words go through the
+    expensive candidate search. Only their corrections are written to the
+    persistent cache, which keeps common vocabulary out of it.
+
+    With several workers, unknown words are corrected in a shared pool of
+    processes that each load the dictionary once, when they start. The pool is
+    kept for later calls until shutdown_correction_workers() or exit.
+
+    A strategy with limits leaves words unchanged when their search is cut short,
+    and such words are not cached.
+
+    Args:
+        words (Iterable[str]): The words to correct, possibly with repeats
+        workers (int | None): Number of worker processes; 1 corrects in this
+        process and None uses one per CPU
+        strategy (CorrectionStrategy): Limits on the search for each correction
+
+    Returns:
+        dict[str, str]: Each distinct word mapped to its correction, or to itself
+    """
+    deadline = None
+    if strategy.document_budget is not None:
+        deadline = time.monotonic() + strategy.document_budget
+
+    unique = list(dict.fromkeys(words))
+    cached = correction_cache.get_many(unique)
+    corrections: dict[str, str] = {}
+    missing: list[str] = []
+    for word, hit in zip(unique, cached, strict=True):
+        if hit is None:
+            missing.append(word)
+        else:
+            corrections[word] = hit
+    found: dict[str, str] = {}
+
+    if missing and persistent_cache is not None:
+        for word in missing:
+            stored = persistent_cache.get(word)
+            if stored is not None:
+                found[word] = stored
+        missing = [word for word in missing if word not in found]
+
+    if missing:
+        unknown_words = get_correction_backend().unknown(missing)
+        unknown = [word for word in missing if word.lower() in unknown_words]
+        found.update(
+            (word, word) for word in missing if word.lower() not in unknown_words
+        )
+
+        if workers != 1 and len(unknown) >= PARALLEL_CORRECTION_THRESHOLD:
+            results = _correct_unknown_parallel(unknown, workers, strategy, deadline)
+        else:
+            results = _correct_unknown(unknown, strategy, deadline)
+        for word, correction in zip(unknown, results, strict=True):
+            if correction is None:
+                corrections[word] = word
+                continue
+            found[word] = correction
+            if persistent_cache is not None:
+                persistent_cache.put(word, correction)
+
+    correction_cache.update(found.items())
+    corrections.update(found)
+    return corrections
+
+
+def tokenize(text: str) -> Iterator[tuple[str, str, str, str]]:
+    """
+    Split text into words, each with its surrounding punctuation and whitespace.
+
+    The tokens are found in a single pass of TOKEN_PATTERN. Concatenating every
+    part of every token gives back the original text.
+
+    Args:
+        text (str): The text to split
+
+    Returns:
+        Iterator[tuple[str, str, str, str]]: The leading punctuation, the word,
+        the trailing punctuation and the following whitespace of each token
+    """
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.end() > match.start():
+            yield cast(
+                tuple[str, str, str, str],
+                match.group("prefix", "core", "suffix", "separator"),
+            )
+
+
+def autocorrection_edits(
+    text: str,
+    workers: int | None = 1,
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+    classifier: SkipClassifier = DEFAULT_CLASSIFIER,
+    lexicon: Lexicon = DEFAULT_LEXICON,
+) -> list[tuple[int, int, str]]:
+    """
+    Find the spelling corrections autocorrect_text would make, as edits to the text.
+
+    Only the misspelled words are returned, so the edits are cheap to review, and
+    apply_edits makes them without rewriting the rest of the text.
+
+    Args:
+        text (str): The input text to correct
+        workers (int | None): Number of processes correcting unknown words, as for
+        correct_words
+        strategy (CorrectionStrategy): Limits on the search for each correction,
+        such as LOW_LATENCY_STRATEGY
+        classifier (SkipClassifier): Picks out words never sent to the spell
+        checker, such as numbers, dates and URLs, and counts them
+        lexicon (Lexicon): Domain terms left unchanged, checked before anything else
+
+    Returns:
+        list[tuple[int, int, str]]: The start and end offsets of each misspelled
+        word in the text, and its correction, in order
+    """
+    # Find every word first, so each distinct word is corrected once
+    spans = [
+        (match.start("core"), match.end("core"), match["core"])
+        for match in TOKEN_PATTERN.finditer(text)
+        if match["core"]
+    ]
+
+    # Skip correction for capitalized words (likely proper nouns), domain terms,
+    # and words such as numbers and URLs that cannot be corrected
+    words = classifier.filter(
+        lexicon.filter(word for _, _, word in spans if not word[0].isupper())
+    )
+    corrections = correct_words(words, workers, strategy)
+
+    return [
+        (start, end, corrections[word])
+        for start, end, word in spans
+        if corrections.get(word, word) != word
+    ]
+
+
+def apply_edits(text: str, edits: Iterable[tuple[int, int, str]]) -> str:
+    """
+    Replace ranges of a text in a single pass.
+
+    Args:
+        text (str): The text to edit
+        edits (Iterable[tuple[int, int, str]]): The start and end offsets of each
+        range to replace, and its replacement, in order and not overlapping
+
+    Returns:
+        str: The edited text
+    """
+    pieces = []
+    position = 0
+    for start, end, replacement in edits:
+        if not position <= start <= end <= len(text):
+            raise ValueError(
+                f"Edit ({start}, {end}) is out of order or outside the text"
+            )
+        pieces.append(text[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def autocorrect_text(
+    text: str,
+    workers: int | None = 1,
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+    classifier: SkipClassifier = DEFAULT_CLASSIFIER,
+    lexicon: Lexicon = DEFAULT_LEXICON,
+) -> str:
+    """
+    Autocorrect misspelled words in a text using pyspellchecker while preserving paragraphs.
+
+    Punctuation around each word and the spacing between words are kept as they are.
+
+    Args:
+        text (str): The input text to correct
+        workers (int | None): Number of processes correcting unknown words, as for
+        correct_words
+        strategy (CorrectionStrategy): Limits on the search for each correction,
+        such as LOW_LATENCY_STRATEGY
+        classifier (SkipClassifier): Picks out words never sent to the spell
+        checker, such as numbers, dates and URLs, and counts them
+        lexicon (Lexicon): Domain terms left unchanged, checked before anything else
+
+    Returns:
+        str: The corrected text with paragraphs preserved
+    """
+    edits = autocorrection_edits(text, workers, strategy, classifier, lexicon)
+    return "\n".join(apply_edits(text, edits).splitlines())
 
 
 def preserve_punctuation(word: str) -> tuple[str, str]:
@@ -119,9 +952,155 @@ def preserve_punctuation(word: str) -> tuple[str, str]:
         tuple[str, str]: A tuple where the first element is the word without trailing
         punctuation, and the second element is the extracted punctuation.
     """
+    core = word.rstrip(PUNCTUATION)
+    return core, word[len(core) :]
 
-    punctuation = ""
-    while word and word[-1] in '.,:;!?()[]{}""\'':
-        punctuation = word[-1] + punctuation
-        word = word[:-1]
-    return word, punctuation
+
+def _process_documents(docs: list[str], autocorrect: bool) -> list[str]:
+    """
+    Normalizes, and optionally autocorrects, a batch of documents in a worker.
+
+    Args:
+        docs (list[str]): The documents to process
+        autocorrect (bool): Whether to autocorrect after normalizing
+
+    Returns:
+        list[str]: The processed documents, in the same order.
+    """
+    # Skip normalize_whitespace's per-call logging, which dominates for short records
+    normalized = [DEFAULT_PIPELINE.apply(doc.splitlines()) for doc in docs]
+    if autocorrect:
+        return [autocorrect_text(doc) for doc in normalized]
+    return normalized
+
+
+def _process_documents_in_worker(docs: list[str], autocorrect: bool) -> list[str]:
+    """Processes a batch like _process_documents, then saves its new corrections."""
+    processed = _process_documents(docs, autocorrect)
+    # Pool workers exit without running atexit, which would otherwise flush
+    if persistent_cache is not None:
+        persistent_cache.flush()
+    return processed
+
+
+def _batched(docs: Iterable[str], size: int) -> Iterator[tuple[int, list[str]]]:
+    """Groups documents into lists of `size`, paired with the first one's index."""
+    iterator = iter(docs)
+    start = 0
+    while batch := list(islice(iterator, size)):
+        yield start, batch
+        start += len(batch)
+
+
+def _process_batches(
+    docs: Iterable[str], autocorrect: bool, workers: int, chunksize: int, ordered: bool
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Processes batches of documents over a process pool.
+
+    At most two batches per worker are in flight at once, so `docs` is consumed
+    lazily and may be larger than memory.
+
+    Args:
+        docs (Iterable[str]): The documents to process
+        autocorrect (bool): Whether to autocorrect after normalizing
+        workers (int): Number of worker processes; 1 processes in this process
+        chunksize (int): Number of documents per task
+        ordered (bool): Whether to yield batches in input order
+
+    Yields:
+        tuple[int, list[str]]: The index of each batch's first document and the
+        processed batch.
+    """
+    batches = _batched(docs, chunksize)
+    if workers == 1:
+        for start, batch in batches:
+            yield start, _process_documents(batch, autocorrect)
+        return
+
+    # Spawned workers start from a fresh import, so they are handed the settings
+    # autocorrect depends on
+    cache_path = persistent_cache.path if persistent_cache is not None else None
+    starts: dict[Future[list[str]], int] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(autocorrect, correction_engine, cache_path, DEFAULT_LEXICON.paths),
+    ) as executor:
+
+        def submit(start: int, batch: list[str]) -> Future[list[str]]:
+            future = executor.submit(_process_documents_in_worker, batch, autocorrect)
+            starts[future] = start
+            return future
+
+        in_flight = deque(submit(*queued) for queued in islice(batches, workers * 2))
+
+        while in_flight:
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [future for future in in_flight if future in finished]
+                for future in done:
+                    in_flight.remove(future)
+            for future in done:
+                for queued in islice(batches, 1):
+                    in_flight.append(submit(*queued))
+                yield starts.pop(future), future.result()
+
+
+@overload
+def normalize_many(
+    docs: Iterable[str],
+    autocorrect: bool = ...,
+    workers: int | None = ...,
+    chunksize: int = ...,
+    ordered: Literal[True] = ...,
+) -> Iterator[str]: ...
+
+
+@overload
+def normalize_many(
+    docs: Iterable[str],
+    autocorrect: bool = ...,
+    workers: int | None = ...,
+    chunksize: int = ...,
+    *,
+    ordered: Literal[False],
+) -> Iterator[tuple[int, str]]: ...
+
+
+def normalize_many(
+    docs: Iterable[str],
+    autocorrect: bool = False,
+    workers: int | None = None,
+    chunksize: int = DOCUMENT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[str] | Iterator[tuple[int, str]]:
+    """
+    Normalizes, and optionally autocorrects, many documents over a process pool.
+
+    Documents are sent to the workers in chunks of `chunksize` to amortize the
+    per-task overhead.
+
+    Args:
+        docs (Iterable[str]): The documents to process
+        autocorrect (bool): Whether to autocorrect after normalizing
+        workers (int | None): Number of worker processes; defaults to the CPU count,
+        and 1 processes every document in the calling process
+        chunksize (int): Number of documents per task
+        ordered (bool): Yield results in input order; if False, yield
+        `(index, result)` pairs as soon as each chunk completes
+
+    Returns:
+        Iterator[str] | Iterator[tuple[int, str]]: The processed documents.
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = _process_batches(docs, autocorrect, workers, chunksize, ordered)
+    if ordered:
+        return (result for _, results in batches for result in results)
+    return (
+        (start + offset, result)
+        for start, results in batches
+        for offset, result in enumerate(results)
+    )
@@ -0,0 +1,463 @@
+"""
+Alternative spelling correction engines built over pyspellchecker's dictionary.
+"""
+
+import string
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+from spellchecker import SpellChecker
+
+from src.log import get_logger
+
+logger = get_logger()
+
+# Only the first characters of each word are indexed, which bounds the number of
+# deletes generated per word without changing which candidates are found
+SYMSPELL_PREFIX_LENGTH = 7
+
+# Words that pass float() but that pyspellchecker still checks
+_FLOAT_WORDS = frozenset(("nan", "inf", "infinity"))
+
+
+@dataclass(frozen=True)
+class CorrectionStrategy:
+    """
+    Limits on the search for a word's correction, trading rare fixes for latency.
+
+    Candidates at edit distance 1 are always tried first, and the search stops as
+    soon as any are found. Words longer than `max_distance2_length` characters are
+    never searched at distance 2. `word_budget` and `document_budget`, in seconds,
+    leave a word unchanged once its own search, or the whole call, runs out of time.
+    """
+
+    max_distance2_length: int | None = None
+    word_budget: float | None = None
+    document_budget: float | None = None
+
+    @property
+    def unlimited(self) -> bool:
+        """Whether every search runs to completion, exactly like pyspellchecker's."""
+        return self == DEFAULT_STRATEGY
+
+
+DEFAULT_STRATEGY = CorrectionStrategy()
+# Bounds the worst case of interactive use while still catching most typos
+LOW_LATENCY_STRATEGY = CorrectionStrategy(
+    max_distance2_length=12, word_budget=0.05, document_budget=2.0
+)
+
+
+def damerau_levenshtein(source: str, target: str) -> int:
+    """
+    Compute the Damerau-Levenshtein distance between two strings.
+
+    This is the unrestricted distance, in which a transposed pair may be edited
+    again, so it counts edits the same way pyspellchecker chains them together.
+
+    Args:
+        source (str): The string to transform
+        target (str): The string to transform it into
+
+    Returns:
+        int: The minimum number of insertions, deletions, substitutions and
+        transpositions of adjacent characters needed
+    """
+    # Common prefixes and suffixes never contribute to the distance
+    start = 0
+    limit = min(len(source), len(target))
+    while start < limit and source[start] == target[start]:
+        start += 1
+    end = 0
+    while end < limit - start and source[-1 - end] == target[-1 - end]:
+        end += 1
+    source = source[start : len(source) - end]
+    target = target[start : len(target) - end]
+    if not source or not target:
+        return len(source) + len(target)
+
+    infinity = len(source) + len(target)
+    rows = [[infinity] * (len(target) + 2)]
+    rows.append([infinity, *range(len(target) + 1)])
+    rows += [[infinity, i] + [0] * len(target) for i in range(1, len(source) + 1)]
+    last_row: dict[str, int] = {}
+    for i, source_char in enumerate(source, 1):
+        last_column = 0
+        for j, target_char in enumerate(target, 1):
+            k = last_row.get(target_char, 0)
+            m = last_column
+            cost = 1
+            if source_char == target_char:
+                cost = 0
+                last_column = j
+            rows[i + 1][j + 1] = min(
+                rows[i][j] + cost,
+                rows[i + 1][j] + 1,
+                rows[i][j + 1] + 1,
+                rows[k][m] + (i - k - 1) + 1 + (j - m - 1),
+            )
+        last_row[source_char] = i
+    return rows[-1][-1]
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """Returns the word and every string reachable by up to `distance` deletes."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {
+            variant[:i] + variant[i + 1 :]
+            for variant in frontier
+            for i in range(len(variant))
+        }
+        found |= frontier
+    return found
+
+
+def _remove_diacritics(word: str) -> str:
+    """Strips combining marks from a word, as pyspellchecker does."""
+    decomposed = unicodedata.normalize("NFKD", word)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _should_check(word: str, longest_word_length: int) -> bool:
+    """Mirrors the words pyspellchecker declines to correct."""
+    if len(word) == 1 and word in string.punctuation:
+        return False
+    if len(word) > longest_word_length + 3:
+        return False
+    if word.lower() in _FLOAT_WORDS:
+        return True
+    try:
+        float(word)
+    except ValueError:
+        return True
+    return False
+
+
+def _most_probable(
+    word: str, candidates: Iterable[str], frequency: Callable[[str], int]
+) -> str:
+    """Picks the candidate pyspellchecker would, preferring matching diacritics."""
+    candidates = sorted(candidates)
+    bare = _remove_diacritics(word)
+    matching = [c for c in candidates if _remove_diacritics(c) == bare]
+    return max(matching or candidates, key=frequency)
+
+
+def _check_deadline(deadline: float | None) -> None:
+    """Raises TimeoutError once time.monotonic() has passed the deadline."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError("Correction time budget exceeded")
+
+
+class CorrectionBackend(Protocol):
+    """
+    A spelling correction engine that autocorrect can use.
+
+    Words are expected to be lowercase dictionary words, as in
+    pyspellchecker's word-frequency dictionary.
+    """
+
+    @property
+    def max_distance(self) -> int:
+        """The largest edit distance at which the engine looks for corrections."""
+        ...
+
+    def unknown(self, words: Iterable[str]) -> set[str]:
+        """Returns the lowercased words that are not in the dictionary."""
+        ...
+
+    def correction(self, word: str, max_distance: int | None = None) -> str | None:
+        """Returns the most probable correction, or None if there is none."""
+        ...
+
+
+def _edit_correction(
+    checker: SpellChecker,
+    word: str,
+    max_distance: int,
+    deadline: float | None = None,
+) -> str | None:
+    """Searches the edits of a word, raising TimeoutError once past the deadline."""
+    _check_deadline(deadline)
+    longest = checker.word_frequency.longest_word_length
+    if checker.known([word]) or not _should_check(word, longest):
+        return word
+    if max_distance < 1:
+        return None
+    frequency = checker.word_frequency.dictionary.__getitem__
+    edits = list(checker.edit_distance_1(word))
+    candidates = checker.known(edits)
+    if not candidates and max_distance > 1:
+        for edit in edits:
+            _check_deadline(deadline)
+            if _should_check(edit, longest):
+                candidates |= checker.known(checker.edit_distance_1(edit))
+    return _most_probable(word, candidates, frequency) if candidates else None
+
+
+class SpellCheckerBackend:
+    """Adapts a pyspellchecker SpellChecker to the CorrectionBackend interface."""
+
+    def __init__(self, checker: SpellChecker) -> None:
+        """
+        Wrap a checker.
+
+        Args:
+            checker (SpellChecker): The checker that finds corrections
+        """
+        self.checker = checker
+
+    @property
+    def max_distance(self) -> int:
+        """The checker's edit distance."""
+        return self.checker.distance
+
+    def unknown(self, words: Iterable[str]) -> set[str]:
+        """
+        Return the words that are not in the dictionary.
+
+        Args:
+            words (Iterable[str]): The words to look up
+
+        Returns:
+            set[str]: The unknown words, lowercased
+        """
+        return self.checker.unknown(words)
+
+    def correction(self, word: str, max_distance: int | None = None) -> str | None:
+        """
+        Return the most probable correct spelling of a word.
+
+        Args:
+            word (str): The word to correct
+            max_distance (int | None): Search only up to this edit distance
+
+        Returns:
+            str | None: The most likely candidate, or None if there is none
+        """
+        if max_distance is None or max_distance >= self.max_distance:
+            return self.checker.correction(word)
+        return _edit_correction(self.checker, word, max_distance)
+
+
+def tiered_correction(
+    backend: CorrectionBackend,
+    word: str,
+    strategy: CorrectionStrategy = DEFAULT_STRATEGY,
+    deadline: float | None = None,
+) -> tuple[str | None, bool]:
+    """
+    Find the most probable correction of a word within a strategy's limits.
+
+    Without limits, this returns what backend.correction(word) returns. Only
+    pyspellchecker's search can be interrupted part of the way through a word;
+    the other engines check the time before starting one.
+
+    Args:
+        backend (CorrectionBackend): The engine whose dictionary to search
+        word (str): The word to correct
+        strategy (CorrectionStrategy): The limits of the search
+        deadline (float | None): A time.monotonic() value after which to give up,
+        on top of the strategy's word budget
+
+    Returns:
+        tuple[str | None, bool]: The correction, or None if there is none, and
+        whether the search was complete. An incomplete result depends on the
+        strategy or on timing and should not be cached.
+    """
+    if strategy.word_budget is not None:
+        word_deadline = time.monotonic() + strategy.word_budget
+        deadline = word_deadline if deadline is None else min(deadline, word_deadline)
+    limit = strategy.max_distance2_length
+    capped = limit is not None and len(word) > limit and backend.max_distance > 1
+    max_distance = 1 if capped else None
+    try:
+        if isinstance(backend, SpellCheckerBackend):
+            correction = _edit_correction(
+                backend.checker, word, max_distance or backend.max_distance, deadline
+            )
+        else:
+            _check_deadline(deadline)
+            correction = backend.correction(word, max_distance)
+    except TimeoutError:
+        return None, False
+    return correction, correction is not None or not capped
+
+
+D = TypeVar("D", bound="DictionaryIndex")
+
+
+class DictionaryIndex(ABC):
+    """
+    A correction engine that searches a word-frequency dictionary itself.
+
+    Subclasses find the closest dictionary words to a word in candidates(), and
+    correction() ranks them the way pyspellchecker ranks them: the smallest
+    distance first, then matching diacritics, then the highest frequency.
+    """
+
+    def __init__(self, frequencies: Mapping[str, int], max_distance: int = 2) -> None:
+        """
+        Keep the dictionary the engine searches.
+
+        Args:
+            frequencies (Mapping[str, int]): Lowercase dictionary words and their
+            frequencies
+            max_distance (int): The largest edit distance at which to look for
+            corrections
+        """
+        self.frequencies = frequencies
+        self.max_distance = max_distance
+        self.longest_word_length = max(map(len, frequencies), default=0)
+
+    @classmethod
+    def from_spellchecker(cls: type[D], checker: SpellChecker, **kwargs: Any) -> D:
+        """
+        Build the engine over a SpellChecker's word-frequency dictionary.
+
+        Args:
+            checker (SpellChecker): The checker whose dictionary to index
+            **kwargs (Any): Passed on to the engine's constructor
+
+        Returns:
+            DictionaryIndex: The engine, using the checker's edit distance by default
+        """
+        kwargs.setdefault("max_distance", checker.distance)
+        return cls(checker.word_frequency.dictionary, **kwargs)
+
+    def unknown(self, words: Iterable[str]) -> set[str]:
+        """
+        Return the words that are not in the dictionary, as pyspellchecker does.
+
+        Args:
+            words (Iterable[str]): The words to look up
+
+        Returns:
+            set[str]: The unknown words, lowercased
+        """
+        longest = self.longest_word_length
+        checked = {word.lower() for word in words if _should_check(word, longest)}
+        return checked - self.frequencies.keys()
+
+    @abstractmethod
+    def candidates(self, word: str, max_distance: int | None = None) -> set[str] | None:
+        """
+        Find the closest dictionary words to a word.
+
+        Args:
+            word (str): The word for which to find corrections
+            max_distance (int | None): Search only up to this edit distance;
+            defaults to the engine's
+
+        Returns:
+            set[str] | None: The word itself if it is known or should not be checked,
+            the dictionary words at the smallest edit distance up to max_distance,
+            or None if there are none
+        """
+
+    def correction(self, word: str, max_distance: int | None = None) -> str | None:
+        """
+        Return the most probable correct spelling of a word.
+
+        Args:
+            word (str): The word to correct
+            max_distance (int | None): Search only up to this edit distance
+
+        Returns:
+            str | None: The most likely candidate, or None if there is none
+        """
+        candidates = self.candidates(word, max_distance)
+        if not candidates:
+            return None
+        frequency = self.frequencies.get
+        return _most_probable(word, candidates, lambda c: frequency(c.lower(), 0))
+
+
+class SymSpellIndex(DictionaryIndex):
+    """
+    A symmetric-delete index over a word-frequency dictionary.
+
+    Every dictionary word is stored under each string reachable from its prefix by
+    up to `max_distance` deletes. A lookup generates the deletes of the misspelled
+    word instead of all of its edits, so finding candidates is a handful of hash
+    probes rather than tens of thousands of generated strings, each verified with
+    the Damerau-Levenshtein distance.
+    """
+
+    def __init__(
+        self,
+        frequencies: Mapping[str, int],
+        max_distance: int = 2,
+        prefix_length: int = SYMSPELL_PREFIX_LENGTH,
+    ) -> None:
+        """
+        Build the index.
+
+        Args:
+            frequencies (Mapping[str, int]): Lowercase dictionary words and their
+            frequencies
+            max_distance (int): The largest edit distance at which to look for
+            corrections
+            prefix_length (int): Number of leading characters of each word indexed;
+            must be greater than max_distance
+        """
+        if prefix_length <= max_distance:
+            raise ValueError(
+                f"prefix_length must exceed max_distance, got {prefix_length}"
+            )
+        super().__init__(frequencies, max_distance)
+        self.prefix_length = prefix_length
+        self._index: dict[str, list[str]] = {}
+        for word in frequencies:
+            for variant in _deletes(word[:prefix_length], max_distance):
+                self._index.setdefault(variant, []).append(word)
+        logger.debug(
+            f"SymSpell index built: {len(frequencies)} words, {len(self._index)} keys"
+        )
+
+    def candidates(self, word: str, max_distance: int | None = None) -> set[str] | None:
+        """
+        Find the closest dictionary words to a word.
+
+        Args:
+            word (str): The word for which to find corrections
+            max_distance (int | None): Search only up to this edit distance, which
+            must not exceed the index's max_distance; defaults to the index's
+
+        Returns:
+            set[str] | None: The word itself if it is known or should not be checked,
+            the dictionary words at the smallest edit distance up to max_distance,
+            or None if there are none
+        """
+        lowered = word.lower()
+        if lowered in self.frequencies or not _should_check(
+            lowered, self.longest_word_length
+        ):
+            return {word}
+
+        if max_distance is None:
+            max_distance = self.max_distance
+        best_distance = max_distance
+        best: set[str] = set()
+        seen: set[str] = set()
+        for variant in _deletes(lowered[: self.prefix_length], self.max_distance):
+            for candidate in self._index.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if abs(len(candidate) - len(lowered)) > max_distance:
+                    continue
+                distance = damerau_levenshtein(lowered, candidate)
+                if distance > best_distance:
+                    continue
+                if distance < best_distance:
+                    best_distance = distance
+                    best.clear()
+                best.add(candidate)
+        return best or None
@@ -4,12 +4,44 @@ from typing import NoReturn
 
 import pyperclip
 
-from src.core import autocorrect_text, normalize_whitespace
+from src.core import apply_edits, warm_up
+from src.incremental import IncrementalNormalizer
 from src.log import logger
 
 logger.debug("Logger initialized for GUI module")
 
 
+def tk_edits(
+    text: str, edits: list[tuple[int, int, str]]
+) -> list[tuple[int, int, str]]:
+    """
+    Converts edit offsets into a text to the character offsets Tk uses.
+
+    Tk 8.6 stores text as UTF-16 and counts a character above U+FFFF as two, so
+    each offset moves forward by the number of such characters before it. Tk 9
+    counts every character as one, and the edits are returned unchanged.
+
+    Args:
+        text (str): The text the edits apply to
+        edits (list[tuple[int, int, str]]): Offsets into the text and their
+        replacements, in order
+
+    Returns:
+        list[tuple[int, int, str]]: The same edits with offsets counted by Tk
+    """
+    if text.isascii() or tk.TkVersion >= 9.0:
+        return edits
+    converted = []
+    position = shift = 0
+    for start, end, replacement in edits:
+        shift += sum(char > "\uffff" for char in text[position:start])
+        inner = sum(char > "\uffff" for char in text[start:end])
+        converted.append((start + shift, end + shift + inner, replacement))
+        shift += inner
+        position = end
+    return converted
+
+
 class WhitespaceNormalizerApp:
     """
     A widget to normalize whitespaces.
@@ -20,12 +52,18 @@ class WhitespaceNormalizerApp:
         self.root.title("Whitespace Normalizer")
         self.root.geometry("800x500")
 
+        # Reuses per-line results between clicks, so edits are cheap to re-run
+        self.normalizer = IncrementalNormalizer()
+
         # Configure the grid layout
         self._configure_layout()
 
         # Create widgets
         self._create_widgets()
 
+        # Load the spell checker in the background once the window is on screen
+        self.root.after_idle(warm_up)
+
     def _configure_layout(self):
         """Configure the responsive grid layout."""
         # Make rows and columns expand properly
@@ -102,13 +140,15 @@ class WhitespaceNormalizerApp:
         # Get input text
         input_text = self.input_text.get("1.0", tk.END)
 
-        # Normalize text
-        normalized_text = normalize_whitespace(input_text)
+        # Normalize text, finding spelling corrections if autocorrect is enabled
+        autocorrect = self.autocorrect_var.get()
+        if autocorrect:
+            normalized_text, edits = self.normalizer.normalize_with_edits(input_text)
+        else:
+            normalized_text, edits = self.normalizer.normalize(input_text), []
 
-        # Apply autocorrect if enabled
-        if self.autocorrect_var.get():
+        if autocorrect:
             logger.info("Autocorrect enabled, applying spell correction")
-            normalized_text = autocorrect_text(normalized_text)
             self.status_label.config(
                 text="Text normalized with autocorrect and copied to clipboard"
             )
@@ -116,15 +156,31 @@ class WhitespaceNormalizerApp:
             logger.info("Autocorrect disabled")
             self.status_label.config(text="Text normalized and copied to clipboard")
 
-        self.copy_to_clipboard(normalized_text)
+        self.copy_to_clipboard(apply_edits(normalized_text, edits))
 
-        # Update output text
+        # Update output text, then replace only the misspelled words
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert("1.0", normalized_text)
+        self.apply_edits_to_output(tk_edits(normalized_text, edits))
 
         # Make sure status update is displayed
         self.root.update_idletasks()
 
+    def apply_edits_to_output(self, edits: list[tuple[int, int, str]]) -> None:
+        """
+        Replaces ranges of the output text in place.
+
+        Args:
+            edits (list[tuple[int, int, str]]): Offsets into the output text, as
+            counted by Tk, and their replacements, in order
+        """
+        # Later ranges first, so the offsets of earlier ones stay valid
+        for start, end, replacement in reversed(edits):
+            self.output_text.replace(
+                f"1.0 + {start} chars", f"1.0 + {end} chars", replacement
+            )
+        logger.debug(f"Applied {len(edits)} corrections to the output")
+
     def copy_to_clipboard(self, normalized_text: str) -> None:
         try:
             pyperclip.copy(normalized_text)
@@ -0,0 +1,140 @@
+"""
+Incremental normalization that only reprocesses the lines changed since the last run.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from src import core
+from src.log import logger
+from src.pipeline import DEFAULT_PIPELINE, NormalizationPipeline
+
+T = TypeVar("T")
+
+
+class IncrementalNormalizer:
+    """
+    Normalizes, and optionally autocorrects, a document that is edited between runs.
+
+    Results are kept per line, keyed by the line's content, and only lines that were
+    not part of the previous run are recomputed. Both normalization and
+    autocorrection treat every line independently, so the output is identical to a
+    full run. Results for lines that disappear from the document are dropped, which
+    bounds the cache to the size of the latest document.
+    """
+
+    def __init__(self, pipeline: NormalizationPipeline = DEFAULT_PIPELINE) -> None:
+        """
+        Initialize the normalizer.
+
+        Args:
+            pipeline (NormalizationPipeline): The normalization rules to apply; they
+            must not match across line boundaries
+        """
+        self.pipeline = pipeline
+        self._normalized: dict[str, str] = {}
+        self._corrected: dict[str, str] = {}
+        self._edits: dict[str, list[tuple[int, int, str]]] = {}
+        self._generation: int | None = None
+
+    def clear(self) -> None:
+        """Forgets every cached line."""
+        self._normalized.clear()
+        self._corrected.clear()
+        self._edits.clear()
+
+    def normalize(self, text: str, autocorrect: bool = False) -> str:
+        """
+        Normalizes the text, reusing the results of unchanged lines.
+
+        Args:
+            text (str): The full input text
+            autocorrect (bool): Whether to autocorrect after normalizing
+
+        Returns:
+            str: The same text normalize_whitespace, followed by autocorrect_text if
+            enabled, would return.
+        """
+        lines = text.splitlines()
+        normalized = self._update(self._normalized, lines, self._normalize_lines)
+        if autocorrect:
+            self._check_generation()
+            normalized = self._update(self._corrected, normalized, self._correct_lines)
+        return "\n".join(normalized)
+
+    def normalize_with_edits(self, text: str) -> tuple[str, list[tuple[int, int, str]]]:
+        """
+        Normalizes the text, and finds its spelling corrections as edits.
+
+        Args:
+            text (str): The full input text
+
+        Returns:
+            tuple[str, list[tuple[int, int, str]]]: The normalized text, and the
+            edits to it that core.apply_edits turns into what normalize returns
+            with autocorrect enabled
+        """
+        lines = text.splitlines()
+        normalized = self._update(self._normalized, lines, self._normalize_lines)
+        self._check_generation()
+        line_edits = self._update(self._edits, normalized, self._edit_lines)
+        edits: list[tuple[int, int, str]] = []
+        offset = 0
+        for line, line_edit in zip(normalized, line_edits, strict=True):
+            edits.extend(
+                (start + offset, end + offset, fix) for start, end, fix in line_edit
+            )
+            offset += len(line) + 1
+        return "\n".join(normalized), edits
+
+    def _check_generation(self) -> None:
+        """Forgets cached corrections made before the lexicon or engine changed."""
+        generation = core.correction_generation()
+        if generation != self._generation:
+            self._corrected.clear()
+            self._edits.clear()
+            self._generation = generation
+
+    def _normalize_lines(self, lines: list[str]) -> list[str]:
+        """Normalizes changed lines in one pass of the pipeline."""
+        return self.pipeline.apply(lines).split("\n")
+
+    @staticmethod
+    def _correct_lines(lines: list[str]) -> list[str]:
+        """Autocorrects changed lines one by one."""
+        return [core.autocorrect_text(line) for line in lines]
+
+    @staticmethod
+    def _edit_lines(lines: list[str]) -> list[list[tuple[int, int, str]]]:
+        """Finds the spelling corrections of changed lines one by one."""
+        return [core.autocorrection_edits(line) for line in lines]
+
+    @staticmethod
+    def _update(
+        cache: dict[str, T],
+        lines: list[str],
+        compute: Callable[[list[str]], list[T]],
+    ) -> list[T]:
+        """
+        Maps every line through the cache, computing only the missing ones.
+
+        Args:
+            cache (dict[str, T]): Results of the previous run, replaced in place by
+            the results of this run
+            lines (list[str]): The lines to map
+            compute (Callable[[list[str]], list[T]]): Computes results for a list of
+            lines
+
+        Returns:
+            list[T]: The result for every line.
+        """
+        missing = list(dict.fromkeys(line for line in lines if line not in cache))
+        computed = dict(zip(missing, compute(missing), strict=True)) if missing else {}
+        logger.debug(f"Incremental run: {len(lines)} lines, {len(missing)} recomputed")
+
+        results = [
+            computed[line] if line in computed else cache[line] for line in lines
+        ]
+        cache.clear()
+        cache.update(zip(lines, results, strict=True))
+        return results
@@ -0,0 +1,109 @@
+"""
+User-supplied domain vocabulary that spelling correction leaves unchanged.
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from src.cache import app_data_dir
+from src.log import get_logger
+
+logger = get_logger()
+
+
+def default_lexicon_dir() -> Path:
+    """
+    Return the directory whose word lists make up the default lexicon.
+
+    Returns:
+        Path: The "lexicon" directory in the user's app data directory
+    """
+    return app_data_dir() / "lexicon"
+
+
+class Lexicon:
+    """
+    A set of domain terms, such as IEP, FAPE or goal codes, that are never corrected.
+
+    Terms are read from word-list files, separated by whitespace, with blank lines
+    and lines starting with # ignored. A directory stands for every .txt file in
+    it. Terms are matched case-insensitively against a frozenset. The files are
+    re-read by reload(), and by refresh() whenever one of them has changed, so
+    edits take effect without restarting the app.
+    """
+
+    def __init__(self, paths: Iterable[str | Path] = ()) -> None:
+        """
+        Initialize the lexicon without reading any file.
+
+        Args:
+            paths (Iterable[str | Path]): Word-list files or directories of them;
+            missing paths are ignored
+        """
+        self.paths = [Path(path) for path in paths]
+        self.words: frozenset[str] = frozenset()
+        # Counts reloads, so callers can tell when earlier results may be stale
+        self.generation = 0
+        self._stamps: dict[Path, int] | None = None
+
+    def _files(self) -> list[Path]:
+        """Lists the word-list files that currently exist."""
+        files = []
+        for path in self.paths:
+            if path.is_dir():
+                files += sorted(path.glob("*.txt"))
+            elif path.is_file():
+                files.append(path)
+        return files
+
+    def _stamp(self) -> dict[Path, int]:
+        """Records the modification time of every word-list file."""
+        return {file: file.stat().st_mtime_ns for file in self._files()}
+
+    def reload(self) -> None:
+        """Re-reads every word-list file."""
+        stamps = self._stamp()
+        words: set[str] = set()
+        for file in stamps:
+            for line in file.read_text(encoding="utf-8").splitlines():
+                if not line.lstrip().startswith("#"):
+                    words.update(term.lower() for term in line.split())
+        self.words = frozenset(words)
+        self._stamps = stamps
+        self.generation += 1
+        logger.info(f"Loaded {len(words)} lexicon terms from {len(stamps)} files")
+
+    def refresh(self) -> bool:
+        """
+        Reload the lexicon if it was never loaded or a word-list file changed.
+
+        Returns:
+            bool: Whether the lexicon was reloaded
+        """
+        if self._stamps is not None and self._stamp() == self._stamps:
+            return False
+        self.reload()
+        return True
+
+    def filter(self, words: Iterable[str]) -> Iterator[str]:
+        """
+        Drop the words that are lexicon terms, refreshing the lexicon first.
+
+        Args:
+            words (Iterable[str]): The words to check
+
+        Returns:
+            Iterator[str]: The words that are not in the lexicon
+        """
+        self.refresh()
+        terms = self.words
+        return (word for word in words if word.lower() not in terms)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+DEFAULT_LEXICON = Lexicon([default_lexicon_dir()])
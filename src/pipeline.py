@@ -0,0 +1,339 @@
+"""
+Declarative normalization rules, compiled into as few passes over the text as possible.
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import NamedTuple
+
+from src.cache import CacheInfo, LRUCache
+
+Replacement = str | Callable[[re.Match[str]], str]
+
+
+@dataclass(frozen=True)
+class StripLines:
+    """
+    Strips leading and trailing characters from every line.
+
+    By default this strips whitespace, exactly like str.strip().
+    """
+
+    characters: str | None = None
+
+
+@dataclass(frozen=True)
+class PatternRule:
+    """
+    Replaces every match of a regular expression within each line.
+
+    The replacement is either a literal string or a callable that receives the match
+    of the pipeline's combined pattern; use `match.group()` for the matched text.
+    `ascii_pattern` is an optional, cheaper pattern that is equivalent on pure ASCII
+    text, used whenever the text is ASCII. Patterns are matched one line at a time,
+    with `^` and `$` at the start and end of each line. Set `single_line` when the
+    pattern can never match a line break, so that all lines are scanned at once.
+    """
+
+    pattern: str
+    replacement: Replacement
+    ascii_pattern: str | None = None
+    single_line: bool = False
+
+    def __post_init__(self) -> None:
+        if isinstance(self.replacement, str) and "\n" in self.replacement:
+            raise ValueError("Pattern replacements must not contain line breaks")
+
+
+@dataclass(frozen=True)
+class CharacterRule:
+    """Replaces every occurrence of each of `characters` with `replacement`."""
+
+    characters: str
+    replacement: str
+
+    def __post_init__(self) -> None:
+        if "\n" in self.characters or "\n" in self.replacement:
+            raise ValueError("Character rules must not map or add line breaks")
+
+
+Rule = StripLines | PatternRule | CharacterRule
+
+# Number of normalized lines the default pipeline remembers
+LINE_CACHE_SIZE = 4096
+
+# Every character str.isspace() accepts; none lie above U+3000
+WHITESPACE = "".join(filter(str.isspace, map(chr, range(0x3001))))
+# Space separators (Unicode category Zs) other than the ASCII space
+UNICODE_SPACES = "\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000"
+# Invisible characters pasted from Word and PDFs. The zero-width joiner and
+# non-joiner are left alone because they change how emoji and some scripts render.
+ZERO_WIDTH_CHARACTERS = "\u00ad\u200b\u2060\ufeff"
+# Straight, curly and prime quotation marks, single and double
+QUOTE_CHARACTERS = (
+    '"`´\u2018\u2019\u201a\u201b\u201c\u201d\u201e\u201f\u2032\u2033\uff02\uff07'
+)
+
+STRIP_LINES = StripLines(WHITESPACE + ZERO_WIDTH_CHARACTERS)
+# A run of spaces of any kind, including zero-width characters inside the run. A
+# lone ASCII space is deliberately not matched, as it is already normalized.
+COLLAPSE_SPACES = PatternRule(
+    f" [ {UNICODE_SPACES}{ZERO_WIDTH_CHARACTERS}]+"
+    f"|[{UNICODE_SPACES}][ {UNICODE_SPACES}{ZERO_WIDTH_CHARACTERS}]*",
+    " ",
+    ascii_pattern="  +",
+    single_line=True,
+)
+FOLD_QUOTES = CharacterRule(QUOTE_CHARACTERS, "'")
+DELETE_ZERO_WIDTH = CharacterRule(ZERO_WIDTH_CHARACTERS, "")
+MAP_TABS = CharacterRule("\t", ", ")
+
+DEFAULT_RULES: tuple[Rule, ...] = (
+    STRIP_LINES,
+    COLLAPSE_SPACES,
+    FOLD_QUOTES,
+    DELETE_ZERO_WIDTH,
+    MAP_TABS,
+)
+
+
+class _CompiledRules(NamedTuple):
+    """The passes a rule configuration compiles into."""
+
+    strip: bool
+    strip_characters: str | None
+    # Applies the pattern rules to any text, and to ASCII text
+    substitutes: tuple[Callable[[str], str], Callable[[str], str]] | None
+    per_line: bool
+    table: dict[int, str | None] | None
+    replacements: tuple[tuple[str, str], ...]
+    expansions: tuple[tuple[str, str], ...]
+
+
+def _compile_patterns(
+    rules: list[PatternRule], ascii: bool = False
+) -> Callable[[str], str]:
+    """
+    Combines pattern rules into a single alternation with a dispatch table.
+
+    Args:
+        rules (list[PatternRule]): The rules to combine; there must be at least one
+        ascii (bool): Whether to use each rule's ASCII-only pattern, if it has one
+
+    Returns:
+        Callable[[str], str]: Applies every rule.
+    """
+    patterns = [(ascii and rule.ascii_pattern) or rule.pattern for rule in rules]
+    if len(rules) == 1:
+        replacement = rules[0].replacement
+        if isinstance(replacement, str):
+            replacement = replacement.replace("\\", "\\\\")
+        return partial(re.compile(patterns[0], re.MULTILINE).sub, replacement)
+
+    dispatch: dict[str, Replacement] = {}
+    alternatives = []
+    for index, (rule, pattern) in enumerate(zip(rules, patterns, strict=True)):
+        name = f"_rule{index}"
+        dispatch[name] = rule.replacement
+        alternatives.append(f"(?P<{name}>{pattern})")
+
+    def replace(match: re.Match[str]) -> str:
+        replacement = dispatch[match.lastgroup or ""]
+        return replacement if isinstance(replacement, str) else replacement(match)
+
+    return partial(re.compile("|".join(alternatives), re.MULTILINE).sub, replace)
+
+
+def _compile_characters(
+    rules: list[CharacterRule],
+) -> tuple[
+    dict[int, str | None] | None,
+    tuple[tuple[str, str], ...],
+    tuple[tuple[str, str], ...],
+]:
+    """
+    Merges character rules into one translation table.
+
+    str.translate is only fast on ASCII text, and only while every replacement is a
+    single character or a deletion. A lone multi-character replacement is therefore
+    applied with str.replace instead, while two or more are merged into the table.
+
+    On non-ASCII text str.translate looks up every character in a dict, which is
+    far slower than scanning for the few mapped characters actually present, so the
+    mapping is also returned as (character, replacement) pairs for str.replace. The
+    pairs are omitted when one replacement contains another mapped character, as
+    replacing one character at a time would then chain replacements.
+    """
+    mapping: dict[str, str] = {}
+    for rule in rules:
+        for character in rule.characters:
+            if character in mapping and mapping[character] != rule.replacement:
+                raise ValueError(f"Conflicting replacements for {character!r}")
+            mapping[character] = rule.replacement
+
+    chains = any(char in mapping for value in mapping.values() for char in value)
+    replacements = () if chains else tuple(mapping.items())
+
+    expanding = [item for item in mapping.items() if len(item[1]) > 1]
+    expansions: tuple[tuple[str, str], ...] = ()
+    if len(expanding) == 1:
+        expansions = tuple(expanding)
+        del mapping[expanding[0][0]]
+
+    table = {ord(key): value or None for key, value in mapping.items()} or None
+    return table, replacements, expansions
+
+
+@lru_cache(maxsize=32)
+def _compile(rules: tuple[Rule, ...]) -> _CompiledRules:
+    """Compiles a rule configuration; identical configurations share one result."""
+    patterns = [rule for rule in rules if isinstance(rule, PatternRule)]
+    characters = [rule for rule in rules if isinstance(rule, CharacterRule)]
+    strips = [rule for rule in rules if isinstance(rule, StripLines)]
+    table, replacements, expansions = _compile_characters(characters)
+    return _CompiledRules(
+        strip=bool(strips),
+        strip_characters=strips[-1].characters if strips else None,
+        substitutes=(
+            (_compile_patterns(patterns), _compile_patterns(patterns, ascii=True))
+            if patterns
+            else None
+        ),
+        per_line=not all(rule.single_line for rule in patterns),
+        table=table,
+        replacements=replacements,
+        expansions=expansions,
+    )
+
+
+class NormalizationPipeline:
+    """
+    A set of normalization rules compiled into as few passes as possible.
+
+    Whatever the number of rules, the text is processed in at most three phases:
+    lines are stripped, then every pattern rule is applied in one scan of a combined
+    regular expression, then every character rule is applied through one merged
+    translation table. Pattern rules therefore see the text before any character
+    rule has been applied. The combined expression scans the whole text at once if
+    every pattern rule is `single_line`, and each line separately otherwise.
+
+    The default rules fold every Unicode space separator and smart quote, and
+    delete zero-width characters, at the same cost per character as the ASCII-only
+    rules.
+
+    A pipeline can also remember the normalized form of recently seen lines, so
+    repeated boilerplate costs a dict lookup.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = DEFAULT_RULES, cache_size: int = 0):
+        """
+        Initialize the pipeline.
+
+        Args:
+            rules (Iterable[Rule]): The rules to apply
+            cache_size (int): Number of normalized lines to remember; 0 disables the
+            line cache
+        """
+        self.rules = tuple(rules)
+        self._compiled = _compile(self.rules)
+        self.line_cache: LRUCache[str, str] | None = None
+        self.configure_cache(cache_size)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rules!r})"
+
+    def with_rules(self, *rules: Rule) -> "NormalizationPipeline":
+        """Returns a new pipeline with `rules` added after the existing ones."""
+        cache_size = self.line_cache.maxsize if self.line_cache else 0
+        return NormalizationPipeline(self.rules + rules, cache_size)
+
+    def configure_cache(self, cache_size: int) -> None:
+        """
+        Replaces the line cache with an empty one of a new size.
+
+        Args:
+            cache_size (int): Number of normalized lines to remember; 0 disables the
+            line cache, which is faster for text without repeated lines
+        """
+        self.line_cache = LRUCache(cache_size) if cache_size > 0 else None
+
+    def cache_info(self) -> CacheInfo | None:
+        """Returns the line cache statistics, or None if the cache is disabled."""
+        return self.line_cache.cache_info() if self.line_cache else None
+
+    def __call__(self, text: str) -> str:
+        """Normalizes a whole text, joining its lines with "\\n"."""
+        return self.apply(text.splitlines())
+
+    def apply(self, lines: list[str]) -> str:
+        """
+        Normalizes a list of lines and joins them with newlines.
+
+        Args:
+            lines (list[str]): Lines without their line terminators
+
+        Returns:
+            str: The normalized lines joined by "\\n".
+        """
+        cache = self.line_cache
+        if cache is None:
+            return self._apply(lines)
+
+        results = cache.get_many(lines)
+        if None not in results:
+            return "\n".join(results)  # type: ignore[arg-type]
+
+        # Normalize each distinct missing line once, in a single pass
+        missing = [
+            line for line, result in zip(lines, results, strict=True) if result is None
+        ]
+        unique = list(dict.fromkeys(missing))
+        normalized = self._apply(unique).split("\n")
+        if len(normalized) != len(unique):
+            raise ValueError("Rules must not add line breaks to cached lines")
+        keep = cache.maxsize
+        cache.update(zip(unique[-keep:], normalized[-keep:], strict=True))
+        if len(unique) == len(lines):
+            return "\n".join(normalized)
+
+        computed = dict(zip(unique, normalized, strict=True))
+        return "\n".join(
+            [
+                computed[line] if result is None else result
+                for line, result in zip(lines, results, strict=True)
+            ]
+        )
+
+    def _apply(self, lines: list[str]) -> str:
+        """Normalizes a list of lines without consulting the line cache."""
+        (
+            strip,
+            characters,
+            substitutes,
+            per_line,
+            table,
+            replacements,
+            expansions,
+        ) = self._compiled
+        if strip:
+            lines = [line.strip(characters) for line in lines]
+        text = "\n".join(lines)
+        if substitutes is not None:
+            substitute, substitute_ascii = substitutes
+            substitute = substitute_ascii if text.isascii() else substitute
+            text = "\n".join(map(substitute, lines)) if per_line else substitute(text)
+        if replacements and not text.isascii():
+            for old, new in replacements:
+                if old in text:
+                    text = text.replace(old, new)
+            return text
+        if table is not None:
+            text = text.translate(table)
+        for old, new in expansions:
+            text = text.replace(old, new)
+        return text
+
+
+DEFAULT_PIPELINE = NormalizationPipeline(cache_size=LINE_CACHE_SIZE)
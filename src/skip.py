@@ -0,0 +1,102 @@
+"""
+Classification of tokens that spelling correction should leave alone.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+# Classes of tokens never sent to the spell checker, tried in order. Each pattern
+# must match a whole word, after surrounding punctuation has been removed.
+DEFAULT_SKIP_RULES: dict[str, str] = {
+    "url": r"(?:[a-z][a-z\d+.-]*://|www\.)\S+",
+    "email": r"[^\s@]+@[^\s@]+\.[^\s@]+",
+    "date": r"\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}",
+    "number": r"[-+]?(?:\d[\d,]*)?\.?\d+(?:%|st|nd|rd|th)?",
+    "identifier": r"[\w-]*\d[\w-]*",
+    "path": r"\S*/\S*",
+}
+
+
+class SkipClassifier:
+    """
+    Classifies words, such as URLs and numbers, that cannot be meaningfully corrected.
+
+    The rules are compiled into a single pattern, so classifying a word is one
+    match no matter how many rules there are. The number of skipped tokens of each
+    class is counted in `counts`.
+    """
+
+    def __init__(self, rules: Mapping[str, str] = DEFAULT_SKIP_RULES) -> None:
+        """
+        Initialize the classifier.
+
+        Args:
+            rules (Mapping[str, str]): Regular expressions keyed by class name, tried
+            in order; names must be valid Python identifiers
+        """
+        for name in rules:
+            if not name.isidentifier():
+                raise ValueError(f"Skip rule name must be an identifier, got {name!r}")
+        self.rules = dict(rules)
+        self.counts: Counter[str] = Counter()
+        alternatives = "|".join(
+            f"(?P<{name}>{pattern})" for name, pattern in self.rules.items()
+        )
+        self._pattern = re.compile(alternatives, re.IGNORECASE) if rules else None
+
+    def with_rules(self, **rules: str | None) -> "SkipClassifier":
+        """
+        Return a new classifier with rules added, replaced, or removed with None.
+
+        Args:
+            **rules (str | None): Patterns keyed by class name
+
+        Returns:
+            SkipClassifier: The new classifier, with its own counts
+        """
+        merged = {**self.rules, **rules}
+        return SkipClassifier(
+            {name: pattern for name, pattern in merged.items() if pattern is not None}
+        )
+
+    def classify(self, word: str) -> str | None:
+        """
+        Return the class of a word that should not be corrected.
+
+        Args:
+            word (str): The word, without surrounding punctuation
+
+        Returns:
+            str | None: The name of the first matching rule, or None
+        """
+        if self._pattern is None:
+            return None
+        match = self._pattern.fullmatch(word)
+        return match.lastgroup if match else None
+
+    def filter(self, words: Iterable[str]) -> list[str]:
+        """
+        Return the distinct words worth correcting, counting the skipped tokens.
+
+        Args:
+            words (Iterable[str]): Words, possibly with repeats
+
+        Returns:
+            list[str]: Each distinct word that no rule matched, in order
+        """
+        kept = []
+        for word, occurrences in Counter(words).items():
+            skipped = self.classify(word)
+            if skipped is None:
+                kept.append(word)
+            else:
+                self.counts[skipped] += occurrences
+        return kept
+
+    def reset_counts(self) -> None:
+        """Sets every skipped-token counter back to zero."""
+        self.counts.clear()
+
+
+DEFAULT_CLASSIFIER = SkipClassifier()
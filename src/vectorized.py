@@ -0,0 +1,173 @@
+"""
+A spelling correction engine that scores whole blocks of the dictionary with NumPy.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.correction import DictionaryIndex, _should_check
+from src.log import get_logger
+
+logger = get_logger()
+
+
+# Letters counted separately by the histogram filter; all others share one count
+_HISTOGRAM_LETTERS = np.frombuffer(
+    "abcdefghijklmnopqrstuvwxyz".encode("utf-32-le"), dtype=np.uint32
+)
+
+
+def _encode(words: list[str], length: int) -> np.ndarray:
+    """Encodes words of the same length as rows of Unicode code points."""
+    data = "".join(words).encode("utf-32-le")
+    return np.frombuffer(data, dtype=np.uint32).reshape(len(words), length)
+
+
+def _histograms(encoded: np.ndarray) -> np.ndarray:
+    """Counts each letter, and all other characters together, in every row."""
+    letters = encoded[:, :, np.newaxis] == _HISTOGRAM_LETTERS
+    counts = letters.sum(axis=1, dtype=np.int16)
+    others = encoded.shape[1] - counts.sum(axis=1, keepdims=True, dtype=np.int16)
+    return np.concatenate([counts, others], axis=1)
+
+
+def bounded_distances(
+    target: np.ndarray, words: np.ndarray, max_distance: int
+) -> np.ndarray:
+    """
+    Compute the optimal string alignment distance from a word to many others at once.
+
+    This is the Damerau-Levenshtein distance in which no substring is edited
+    twice. The dynamic programming table is filled one row per target character,
+    for every word at the same time. Insertions along a row are resolved with a
+    running minimum, and words whose last two rows exceed `max_distance` are dropped
+    early.
+
+    Args:
+        target (np.ndarray): Code points of the word being corrected
+        words (np.ndarray): Code points of the words to compare with, one equally
+        long word per row
+        max_distance (int): Distances above this are not computed exactly
+
+    Returns:
+        np.ndarray: The distance to each word, or max_distance + 1 where it exceeds
+        max_distance
+    """
+    count, length = words.shape
+    result = np.full(count, max_distance + 1, dtype=np.int32)
+    if count == 0:
+        return result
+    columns = np.arange(length + 1, dtype=np.int32)
+    remaining = np.arange(count)
+    previous2: np.ndarray | None = None
+    previous = np.tile(columns, (count, 1))
+
+    for i, char in enumerate(target, 1):
+        cost = (words != char).astype(np.int32)
+        best = np.minimum(previous[:, :-1] + cost, previous[:, 1:] + 1)
+        if previous2 is not None and length > 1:
+            swapped = (words[:, :-1] == char) & (words[:, 1:] == target[i - 2])
+            best[:, 1:] = np.where(
+                swapped, np.minimum(best[:, 1:], previous2[:, :-2] + 1), best[:, 1:]
+            )
+        row = np.empty_like(previous)
+        row[:, 0] = i
+        row[:, 1:] = best
+        current = np.minimum.accumulate(row - columns, axis=1) + columns
+
+        alive = np.minimum(current.min(axis=1), previous.min(axis=1)) <= max_distance
+        if not alive.all():
+            words, current, previous = words[alive], current[alive], previous[alive]
+            remaining = remaining[alive]
+            if not len(remaining):
+                return result
+        previous2, previous = previous, current
+
+    result[remaining] = np.minimum(previous[:, -1], max_distance + 1)
+    return result
+
+
+class VectorizedIndex(DictionaryIndex):
+    """
+    A word-frequency dictionary laid out as contiguous NumPy arrays, one per length.
+
+    A correction compares the word with every dictionary word within
+    `max_distance` characters of its length. Words whose letter counts differ by
+    more than twice `max_distance` are ruled out first, since one edit changes
+    them by at most two, and bounded_distances scores the rest. The cost of a lookup
+    depends on how many words have a similar length, not on how many edits of
+    the word there are, so long words are no slower than short ones. Since those
+    distances never edit a transposed pair again, words pyspellchecker only
+    reaches that way, such as "word" from "olwrd", are not found.
+    """
+
+    def __init__(self, frequencies: Mapping[str, int], max_distance: int = 2) -> None:
+        """
+        Build the index.
+
+        Args:
+            frequencies (Mapping[str, int]): Lowercase dictionary words and their
+            frequencies
+            max_distance (int): The largest edit distance at which to look for
+            corrections
+        """
+        super().__init__(frequencies, max_distance)
+        by_length: dict[int, list[str]] = {}
+        for word in frequencies:
+            by_length.setdefault(len(word), []).append(word)
+        self._buckets = {}
+        for length, words in by_length.items():
+            encoded = _encode(words, length)
+            self._buckets[length] = (np.array(words), encoded, _histograms(encoded))
+        logger.debug(
+            f"Vectorized index built: {len(frequencies)} words, "
+            f"{len(self._buckets)} lengths"
+        )
+
+    def candidates(self, word: str, max_distance: int | None = None) -> set[str] | None:
+        """
+        Find the closest dictionary words to a word.
+
+        Args:
+            word (str): The word for which to find corrections
+            max_distance (int | None): Search only up to this edit distance;
+            defaults to the index's
+
+        Returns:
+            set[str] | None: The word itself if it is known or should not be checked,
+            the dictionary words at the smallest edit distance up to max_distance,
+            or None if there are none
+        """
+        lowered = word.lower()
+        if lowered in self.frequencies or not _should_check(
+            lowered, self.longest_word_length
+        ):
+            return {word}
+
+        if max_distance is None:
+            max_distance = self.max_distance
+        encoded_word = _encode([lowered], len(lowered))
+        target = encoded_word[0]
+        histogram = _histograms(encoded_word)
+        best_distance = max_distance
+        best: set[str] = set()
+        for length in range(
+            max(len(lowered) - max_distance, 1), len(lowered) + max_distance + 1
+        ):
+            if length not in self._buckets:
+                continue
+            words, encoded, histograms = self._buckets[length]
+            difference = np.abs(histograms - histogram).sum(axis=1)
+            near = np.flatnonzero(difference <= 2 * best_distance)
+            if not len(near):
+                continue
+            distances = bounded_distances(target, encoded[near], best_distance)
+            closest = int(distances.min())
+            if closest > best_distance:
+                continue
+            if closest < best_distance:
+                best_distance = closest
+                best.clear()
+            best.update(words[near[distances == closest]].tolist())
+        return best or None
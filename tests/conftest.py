@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from spellchecker import SpellChecker
 
 # Add the src directory to the path so tests can import from it
 src_path = Path(__file__).resolve().parent.parent / "src"
@@ -16,6 +17,27 @@ if src_path.exists():
 else:
     raise FileNotFoundError(f"Source directory not found: {src_path}")
 
+# The dictionary of the checker fixture
+WORDS = ["hello", "help", "world", "word", "spelling", "student", "reading", "café"]
+
+
+@pytest.fixture(autouse=True)
+def clear_correction_cache():
+    """Start every test with an empty word correction cache."""
+    from src.core import correction_cache
+
+    correction_cache.clear()
+    yield
+    correction_cache.clear()
+
+
+@pytest.fixture
+def checker():
+    """A SpellChecker over a small dictionary."""
+    checker = SpellChecker(language=None)
+    checker.word_frequency.load_words(WORDS * 2 + ["hello", "word"])
+    return checker
+
 
 @pytest.fixture
 def root():
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.aio import autocorrect_async, normalize_async
+from src.core import autocorrect_text, normalize_whitespace
+
+SAMPLE = '  This   is\ta  test  with "quotes"   \r\n\n  \nsecond  line  \n' * 20
+
+
+class TestNormalizeAsync:
+    """Tests for the normalize_async function."""
+
+    @pytest.mark.parametrize("chunk_lines", [1, 3, 500])
+    def test_matches_serial(self, chunk_lines):
+        """Chunked output is identical to normalize_whitespace."""
+        result = asyncio.run(normalize_async(SAMPLE, chunk_lines=chunk_lines))
+        assert result == normalize_whitespace(SAMPLE)
+
+    def test_empty(self):
+        """An empty text gives an empty result."""
+        assert asyncio.run(normalize_async("")) == ""
+
+    def test_event_loop_keeps_running(self):
+        """Other tasks run while the text is processed."""
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            await normalize_async(SAMPLE, chunk_lines=1)
+            ticker.cancel()
+
+        asyncio.run(run())
+        assert ticks > 0
+
+    def test_timeout_stops_remaining_chunks(self):
+        """A timed out call starts no further chunks."""
+
+        def slow_apply(lines):
+            time.sleep(0.05)
+            return "\n".join(lines)
+
+        pipeline = MagicMock()
+        pipeline.apply.side_effect = slow_apply
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    normalize_async("line\n" * 20, pipeline, chunk_lines=1), 0.08
+                )
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+        assert pipeline.apply.call_count < 5
+
+    def test_invalid_chunk_lines(self):
+        """Chunks must hold at least one line."""
+        with pytest.raises(ValueError):
+            asyncio.run(normalize_async(SAMPLE, chunk_lines=0))
+
+
+class TestAutocorrectAsync:
+    """Tests for the autocorrect_async function."""
+
+    @pytest.mark.parametrize("chunk_lines", [1, 2, 500])
+    @patch("src.core.spell")
+    def test_matches_serial(self, mock_spell, chunk_lines):
+        """Chunked output is identical to autocorrect_text."""
+        mock_spell.unknown.side_effect = lambda words: {w.lower() for w in words}
+        mock_spell.correction.side_effect = {"helo": "hello", "wrold": "world"}.get
+        text = "helo  wrold,\r\n\nsay helo\n(wrold)\n\n"
+        result = asyncio.run(autocorrect_async(text, chunk_lines=chunk_lines))
+        assert result == autocorrect_text(text)
+        assert result == "hello  world,\n\nsay hello\n(world)\n"
@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.bktree import BKTree
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Where the tree is saved."""
+    return tmp_path / "bktree.marshal"
+
+
+class TestBKTree:
+    """Tests for the BKTree class."""
+
+    def test_saved_after_first_build(self, checker, path):
+        """A saved tree is loaded instead of being built again."""
+        built = BKTree.from_spellchecker(checker, path)
+        assert path.exists()
+        with patch.object(BKTree, "_build") as mock_build:
+            loaded = BKTree.from_spellchecker(checker, path)
+        mock_build.assert_not_called()
+        assert loaded.correction("wrold") == built.correction("wrold")
+
+    def test_rebuilt_for_another_dictionary(self, checker, path):
+        """A tree saved for a different dictionary is not reused."""
+        BKTree.from_spellchecker(checker, path)
+        checker.word_frequency.load_words(["wold"])
+        with patch.object(BKTree, "_build", wraps=BKTree._build) as mock_build:
+            tree = BKTree.from_spellchecker(checker, path)
+        mock_build.assert_called_once()
+        assert tree.correction("wold") == "wold"
+
+    def test_rebuilt_when_corrupt(self, checker, path):
+        """An unreadable tree file is replaced."""
+        path.write_bytes(b"not a tree")
+        assert BKTree.from_spellchecker(checker, path).correction("wrold") == "world"
@@ -0,0 +1,183 @@
+import sqlite3
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src import core
+from src.cache import CacheInfo, LRUCache, PersistentCache
+from src.core import autocorrect_text, correct_words, correction_cache
+
+
+class TestLRUCache:
+    """Tests for the LRUCache class."""
+
+    def test_get_and_put(self):
+        """Stored values are returned and lookups are counted."""
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.put("a", "A")
+        assert cache.get("a") == "A"
+        assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    def test_evicts_least_recently_used(self):
+        """The entry unused for the longest time is evicted first."""
+        cache = LRUCache(2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_get_many(self):
+        """Several keys can be looked up at once."""
+        cache = LRUCache(4)
+        cache.update([("a", "A"), ("b", "B")])
+        assert cache.get_many(["a", "x", "b"]) == ["A", None, "B"]
+        assert cache.cache_info().hits == 2
+        assert cache.cache_info().misses == 1
+
+    def test_update_beyond_maxsize(self):
+        """Updating with more items than fit keeps the most recent ones."""
+        cache = LRUCache(2)
+        cache.update((str(i), i) for i in range(5))
+        assert cache.get_many(["3", "4"]) == [3, 4]
+        assert len(cache) == 2
+
+    def test_hit_rate(self):
+        """The hit rate is the fraction of lookups that were hits."""
+        cache = LRUCache(2)
+        assert cache.cache_info().hit_rate == 0.0
+        cache.put("a", "A")
+        cache.get_many(["a", "a", "a", "b"])
+        assert cache.cache_info().hit_rate == 0.75
+
+    def test_clear(self):
+        """Clearing removes entries and resets statistics."""
+        cache = LRUCache(2)
+        cache.put("a", "A")
+        cache.get("a")
+        cache.clear()
+        assert cache.cache_info() == CacheInfo(0, 0, 2, 0)
+
+    def test_invalid_maxsize(self):
+        """The cache must be able to hold at least one entry."""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+    def test_maxbytes_evicts_oldest(self):
+        """Entries are evicted once their approximate size exceeds maxbytes."""
+        size = sys.getsizeof("a") + sys.getsizeof("A")
+        cache = LRUCache(10, maxbytes=size * 2)
+        cache.update([("a", "A"), ("b", "B"), ("c", "C")])
+        assert "a" not in cache
+        assert len(cache) == 2
+        assert cache.cache_info().currbytes == size * 2
+
+    def test_maxbytes_replacing_value(self):
+        """Replacing a value accounts for the size of the old one."""
+        cache = LRUCache(10, maxbytes=10_000)
+        cache.put("a", "A" * 100)
+        cache.put("a", "A")
+        assert cache.cache_info().currbytes == sys.getsizeof("a") + sys.getsizeof("A")
+
+
+class TestCorrectWords:
+    """Tests for the word-level correction cache in front of the spell checker."""
+
+    @patch("src.core.spell")
+    def test_each_word_corrected_once(self, mock_spell):
+        """Repeated words across different texts are looked up only once."""
+        mock_spell.unknown.side_effect = lambda words: {w.lower() for w in words}
+        mock_correction = mock_spell.correction
+        mock_correction.side_effect = lambda word: {"helo": "hello"}.get(word, word)
+        assert autocorrect_text("helo wrld") == "hello wrld"
+        assert autocorrect_text("wrld, helo!") == "wrld, hello!"
+        assert mock_correction.call_count == 2
+        assert correction_cache.cache_info().hit_rate == 0.5
+
+    @patch("src.core.spell")
+    def test_missing_correction_cached(self, mock_spell):
+        """Words without a correction are cached as themselves."""
+        mock_spell.unknown.side_effect = lambda words: set(words)
+        mock_correction = mock_spell.correction
+        mock_correction.return_value = None
+        assert correct_words(["unknwn"]) == {"unknwn": "unknwn"}
+        assert correct_words(["unknwn"]) == {"unknwn": "unknwn"}
+        mock_correction.assert_called_once_with("unknwn")
+
+
+class TestPersistentCache:
+    """Tests for the PersistentCache class."""
+
+    def test_survives_reopening(self, tmp_path):
+        """Entries written by one instance are read by the next."""
+        path = tmp_path / "cache.sqlite3"
+        cache = PersistentCache(path, "v1")
+        cache.put("helo", "hello")
+        cache.close()
+        assert PersistentCache(path, "v1").get("helo") == "hello"
+
+    def test_lazy_and_batched(self, tmp_path):
+        """Nothing touches the disk until used, and writes wait for a full batch."""
+        path = tmp_path / "cache.sqlite3"
+        cache = PersistentCache(path, "v1", batch_size=2)
+        assert not path.exists()
+        cache.put("a", "A")
+        assert len(PersistentCache(path, "v1")) == 0
+        cache.put("b", "B")
+        assert len(PersistentCache(path, "v1")) == 2
+
+    def test_namespaces_are_separate(self, tmp_path):
+        """Entries stored under one namespace are invisible to another."""
+        path = tmp_path / "cache.sqlite3"
+        cache = PersistentCache(path, "v1")
+        cache.put("helo", "hello")
+        cache.flush()
+        assert PersistentCache(path, "v2").get("helo") is None
+
+    @patch("src.core.spell")
+    def test_correct_words_uses_persistent_cache(self, mock_spell, tmp_path):
+        """Corrections from an earlier session are reused without the checker."""
+        mock_spell.unknown.side_effect = lambda words: {"helo"} & set(words)
+        mock_spell.correction.return_value = "hello"
+        path = tmp_path / "cache.sqlite3"
+        try:
+            core.enable_persistent_cache(path)
+            assert correct_words(["helo", "world"]) == {
+                "helo": "hello",
+                "world": "world",
+            }
+            core.enable_persistent_cache(path)
+            correction_cache.clear()
+            assert correct_words(["helo"]) == {"helo": "hello"}
+            assert core.persistent_cache.get("world") is None
+        finally:
+            core.disable_persistent_cache()
+        mock_spell.correction.assert_called_once_with("helo")
+
+    def test_normalize_many_workers_save_corrections(self, tmp_path):
+        """Corrections made in normalize_many's worker processes reach the disk."""
+        path = tmp_path / "cache.sqlite3"
+        docs = ["helo  wrold", "studnet", "teh  raeding"] * 4
+        try:
+            core.enable_persistent_cache(path)
+            list(core.normalize_many(docs, autocorrect=True, workers=2, chunksize=1))
+            with sqlite3.connect(path) as connection:
+                rows = dict(connection.execute("SELECT key, value FROM entries"))
+        finally:
+            core.disable_persistent_cache()
+        assert rows["studnet"] == "student"
+        assert {"helo", "wrold", "teh", "raeding"} <= rows.keys()
+
+    @patch("src.core.spell")
+    def test_unique_unknown_words_corrected_once(self, mock_spell):
+        """Known words are filtered in bulk, and repeated misspellings resolved once."""
+        mock_spell.unknown.side_effect = lambda words: {"helo"} & set(words)
+        mock_spell.correction.return_value = "hello"
+        text = "helo world\nhelo, helo world!"
+        assert autocorrect_text(text) == "hello world\nhello, hello world!"
+        mock_spell.unknown.assert_called_once_with(["helo", "world"])
+        mock_spell.correction.assert_called_once_with("helo")
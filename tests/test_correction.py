@@ -0,0 +1,163 @@
+from unittest.mock import patch
+
+import pytest
+
+from src import core
+from src.correction import (
+    CorrectionStrategy,
+    DictionaryIndex,
+    SpellCheckerBackend,
+    SymSpellIndex,
+    damerau_levenshtein,
+    tiered_correction,
+)
+
+MISSPELLINGS = ["helo", "hlelo", "wrold", "wordl", "speling", "studnet", "raeding"]
+
+
+@pytest.fixture
+def bktree_path(tmp_path):
+    """Saves BK-trees built by a test in a temporary directory."""
+    path = tmp_path / "bktree.marshal"
+    with patch("src.bktree.default_bktree_path", return_value=path):
+        yield path
+
+
+class TestDamerauLevenshtein:
+    """Tests for the damerau_levenshtein function."""
+
+    @pytest.mark.parametrize(
+        "source, target, expected",
+        [
+            ("", "", 0),
+            ("abc", "", 3),
+            ("kitten", "sitting", 3),
+            ("ab", "ba", 1),
+            ("ca", "abc", 2),
+            ("hello", "hello", 0),
+            ("speling", "spelling", 1),
+        ],
+    )
+    def test_distance(self, source, target, expected):
+        """Transpositions count as a single edit and may be edited again."""
+        assert damerau_levenshtein(source, target) == expected
+        assert damerau_levenshtein(target, source) == expected
+
+
+@pytest.mark.usefixtures("bktree_path")
+class TestCorrectionBackends:
+    """Tests every engine in CORRECTION_BACKENDS against pyspellchecker."""
+
+    @pytest.mark.parametrize("engine", core.CORRECTION_BACKENDS)
+    @pytest.mark.parametrize("word", MISSPELLINGS + ["xyzzy", "cafe", "42", "Hello"])
+    def test_agrees_on_sample_words(self, checker, engine, word):
+        """On these words every engine agrees; test_vectorized.py shows where not."""
+        backend = core.CORRECTION_BACKENDS[engine](checker)
+        assert backend.unknown([word]) == checker.unknown([word])
+        assert backend.correction(word) == checker.correction(word)
+        if isinstance(backend, DictionaryIndex):
+            assert backend.candidates(word) == checker.candidates(word)
+
+    @pytest.mark.parametrize("engine", core.CORRECTION_BACKENDS)
+    def test_max_distance(self, checker, engine):
+        """Corrections further away than the requested distance are not found."""
+        backend = core.CORRECTION_BACKENDS[engine](checker)
+        assert backend.correction("raedng") == "reading"
+        assert backend.correction("raedng", max_distance=1) is None
+
+
+class TestSymSpellIndex:
+    """Tests for the SymSpellIndex class."""
+
+    def test_prefix_length_must_exceed_distance(self):
+        """A prefix no longer than the edit distance could miss candidates."""
+        with pytest.raises(ValueError):
+            SymSpellIndex({"word": 1}, max_distance=2, prefix_length=2)
+
+
+class TestTieredCorrection:
+    """Tests for the tiered_correction function."""
+
+    @pytest.mark.parametrize("word", MISSPELLINGS + ["hlp", "xyzzy", "hello", "42"])
+    def test_matches_pyspellchecker_without_limits(self, checker, word):
+        """Without limits, the search finds what pyspellchecker finds."""
+        strategy = CorrectionStrategy(word_budget=60)
+        backend = SpellCheckerBackend(checker)
+        assert tiered_correction(backend, word, strategy) == (
+            checker.correction(word),
+            True,
+        )
+
+    @pytest.mark.usefixtures("bktree_path")
+    @pytest.mark.parametrize("engine", core.CORRECTION_BACKENDS)
+    def test_length_cap(self, checker, engine):
+        """Long words are only searched at distance 1."""
+        backend = core.CORRECTION_BACKENDS[engine](checker)
+        strategy = CorrectionStrategy(max_distance2_length=5)
+        assert tiered_correction(backend, "speling", strategy) == ("spelling", True)
+        assert tiered_correction(backend, "raedng", strategy) == (None, False)
+        assert tiered_correction(backend, "raedng") == ("reading", True)
+
+    def test_expired_deadline(self, checker):
+        """A search that runs out of time gives up, and says so."""
+        backend = SpellCheckerBackend(checker)
+        assert tiered_correction(backend, "raedng", deadline=0) == (None, False)
+
+    @patch("src.core.tiered_correction", return_value=(None, False))
+    @patch("src.core.spell")
+    def test_incomplete_results_not_cached(self, mock_spell, mock_tiered):
+        """Words left unchanged by a limit are retried on the next call."""
+        mock_spell.unknown.side_effect = lambda words: set(words)
+        strategy = CorrectionStrategy(document_budget=1.0)
+        assert core.autocorrect_text("raeding", strategy=strategy) == "raeding"
+        assert "raeding" not in core.correction_cache
+
+
+class TestCorrectionEngine:
+    """Tests for selecting the engine used by autocorrect_text."""
+
+    @pytest.mark.usefixtures("bktree_path")
+    @pytest.mark.parametrize("engine", ["symspell", "numpy", "bktree"])
+    def test_index_engine(self, checker, engine):
+        """An indexed engine is used once selected."""
+        index = core.CORRECTION_BACKENDS[engine](checker)
+        with (
+            patch.dict(core._backends, {engine: index}),
+            patch.object(core, "spell") as mock_spell,
+        ):
+            core.set_correction_engine(engine)
+            try:
+                assert core.autocorrect_text("helo wrold") == "hello world"
+            finally:
+                core.set_correction_engine("pyspellchecker")
+        mock_spell.correction.assert_not_called()
+
+    def test_unknown_engine(self):
+        """Unknown engine names are rejected."""
+        with pytest.raises(ValueError):
+            core.set_correction_engine("aspell")
+
+
+class TestLazySpellChecker:
+    """Tests for the lazily loaded shared SpellChecker."""
+
+    @patch("src.core.load_spellchecker")
+    def test_loaded_once_on_first_use(self, mock_spellchecker):
+        """The checker is only constructed when first needed, and then reused."""
+        with patch.object(core, "_spell", None):
+            mock_spellchecker.assert_not_called()
+            assert core.get_spellchecker() is core.get_spellchecker()
+            assert core.spell is mock_spellchecker.return_value
+        mock_spellchecker.assert_called_once()
+
+    @patch("src.core.load_spellchecker")
+    def test_warm_up(self, mock_spellchecker):
+        """Warming up loads the checker on a background thread."""
+        with patch.object(core, "_spell", None):
+            core.warm_up().join()
+            assert core._spell is mock_spellchecker.return_value
+
+    def test_assigned_spell_takes_precedence(self):
+        """A checker assigned to the module replaces the shared one."""
+        with patch("src.core.spell") as mock_spell:
+            assert core.get_spellchecker() is mock_spell
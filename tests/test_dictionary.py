@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from spellchecker import SpellChecker
+
+from src.dictionary import build_snapshot, load_spellchecker
+
+WORDS = ["hello", "hello", "world", "spelling"]
+
+
+class TestDictionarySnapshot:
+    """Tests for building and loading dictionary snapshots."""
+
+    @patch("src.dictionary.SpellChecker", wraps=SpellChecker)
+    def test_round_trip(self, mock_spellchecker, tmp_path):
+        """A snapshot loads the same word frequencies it was built from."""
+        source = SpellChecker(language=None)
+        source.word_frequency.load_words(WORDS)
+        mock_spellchecker.side_effect = lambda language=None, **kwargs: (
+            source if language else SpellChecker(language=None, **kwargs)
+        )
+        path = build_snapshot("en", tmp_path / "en.marshal")
+
+        checker = load_spellchecker("en", distance=1, path=path)
+        assert checker.word_frequency.dictionary == {
+            "hello": 2,
+            "world": 1,
+            "spelling": 1,
+        }
+        assert checker.distance == 1
+        assert checker.correction("wrld") == "world"
+
+    @patch("src.dictionary.SpellChecker")
+    def test_missing_snapshot_falls_back(self, mock_spellchecker, tmp_path):
+        """Without a snapshot, pyspellchecker loads the dictionary itself."""
+        load_spellchecker("en", path=tmp_path / "missing.marshal")
+        mock_spellchecker.assert_called_once_with(language="en", distance=2)
+
+    @patch("src.dictionary.SpellChecker")
+    def test_corrupt_snapshot_falls_back(self, mock_spellchecker, tmp_path):
+        """An unreadable snapshot is ignored."""
+        path = tmp_path / "en.marshal"
+        path.write_bytes(b"not a snapshot")
+        load_spellchecker("en", path=path)
+        mock_spellchecker.assert_called_once_with(language="en", distance=2)
+
+    @patch("src.dictionary.SpellChecker")
+    def test_other_language_falls_back(self, mock_spellchecker, tmp_path):
+        """A snapshot built for another language is not used."""
+        mock_spellchecker.return_value.word_frequency.dictionary = {"hola": 1}
+        path = build_snapshot("es", tmp_path / "es.marshal")
+        mock_spellchecker.reset_mock()
+        load_spellchecker("en", path=path)
+        mock_spellchecker.assert_called_once_with(language="en", distance=2)
@@ -20,40 +20,42 @@ def test_app_initialization(app):
 
 
 @pytest.mark.skip("Skipping test for now")
-@patch("src.gui.normalize_whitespace", return_value="normalized text")
-@patch("src.gui.autocorrect_text", return_value="autocorrected text")
 @patch("src.gui.pyperclip.copy")
-def test_normalize_and_copy_without_autocorrect(
-    mock_copy, mock_autocorrect, mock_normalize, app
-):
+def test_normalize_and_copy_without_autocorrect(mock_copy, app):
     """Test normalize_and_copy without autocorrect."""
     app.input_text.insert("1.0", "   test text   ")
     app.autocorrect_var.set(False)
 
-    app.normalize_and_copy()
+    with (
+        patch.object(
+            app.normalizer, "normalize", return_value="normalized text"
+        ) as mock_normalize,
+        patch.object(app.normalizer, "normalize_with_edits") as mock_edits,
+    ):
+        app.normalize_and_copy()
 
-    mock_normalize.assert_called_once_with("   test text   ")
-    mock_autocorrect.assert_not_called()
+    mock_normalize.assert_called_once_with("   test text   \n")
+    mock_edits.assert_not_called()
     mock_copy.assert_called_once_with("normalized text")
     assert app.output_text.get("1.0", tkinter.END).strip() == "normalized text"
     assert app.status_label.cget("text") == "Text normalized and copied to clipboard"
 
 
 @pytest.mark.skip("Skipping test for now")
-@patch("src.gui.normalize_whitespace", return_value="normalized text")
-@patch("src.gui.autocorrect_text", return_value="autocorrected text")
 @patch("src.gui.pyperclip.copy")
-def test_normalize_and_copy_with_autocorrect(
-    mock_copy, mock_autocorrect, mock_normalize, app
-):
+def test_normalize_and_copy_with_autocorrect(mock_copy, app):
     """Test normalize_and_copy with autocorrect."""
     app.input_text.insert("1.0", "   test text   ")
     app.autocorrect_var.set(True)
 
-    app.normalize_and_copy()
+    with patch.object(
+        app.normalizer,
+        "normalize_with_edits",
+        return_value=("normalized text", [(0, 10, "autocorrected")]),
+    ) as mock_edits:
+        app.normalize_and_copy()
 
-    mock_normalize.assert_called_once_with("   test text   ")
-    mock_autocorrect.assert_called_once_with("normalized text")
+    mock_edits.assert_called_once_with("   test text   \n")
     mock_copy.assert_called_once_with("autocorrected text")
     assert app.output_text.get("1.0", tkinter.END).strip() == "autocorrected text"
     assert (
@@ -3,7 +3,33 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.gui import WhitespaceNormalizerApp, logger
+from src.gui import WhitespaceNormalizerApp, logger, tk_edits
+
+
+class TestTkEdits:
+    """Tests for the tk_edits function."""
+
+    def test_ascii_offsets_unchanged(self):
+        """Offsets into text without wide characters are kept as they are."""
+        edits = [(0, 3, "the"), (4, 7, "cat")]
+        assert tk_edits("teh cta", edits) == edits
+
+    def test_non_bmp_characters_count_twice(self):
+        """Characters above U+FFFF before or inside an edit shift its offsets."""
+        text = "\U0001f600 teh caf\u00e9 \U0001f600\U0001f600x cta"
+        edits = [(2, 5, "the"), (11, 14, "\U0001f600"), (15, 18, "cat")]
+        with patch.object(tk, "TkVersion", 8.6):
+            assert tk_edits(text, edits) == [
+                (3, 6, "the"),
+                (12, 17, "\U0001f600"),
+                (18, 21, "cat"),
+            ]
+
+    def test_tk9_counts_code_points(self):
+        """Tk 9 counts every character once, so offsets are kept as they are."""
+        edits = [(2, 5, "the")]
+        with patch.object(tk, "TkVersion", 9.0):
+            assert tk_edits("\U0001f600 teh", edits) == edits
 
 
 @pytest.mark.skip("Need to review.")
@@ -27,15 +53,14 @@ class TestGuiModuleImports:
 class TestGuiEdgeCases:
     """Tests for edge cases and error handling in the GUI."""
 
-    @patch("src.gui.normalize_whitespace")
-    @patch("src.gui.autocorrect_text")
+    @patch("src.gui.IncrementalNormalizer")
     @patch("src.gui.pyperclip.copy")
-    def test_empty_input(self, mock_copy, mock_autocorrect, mock_normalize):
+    def test_empty_input(self, mock_copy, mock_normalizer):
         """Test behavior with empty input."""
         # Setup mocks
         root = MagicMock()
-        mock_normalize.return_value = ""
-        mock_autocorrect.return_value = ""
+        mock_edits = mock_normalizer.return_value.normalize_with_edits
+        mock_edits.return_value = ("", [])
 
         with patch("src.gui.logger", autospec=True):
             app = WhitespaceNormalizerApp(root)
@@ -48,11 +73,8 @@ class TestGuiEdgeCases:
             # Call normalize_and_copy
             app.normalize_and_copy()
 
-            # Normalize should be called with empty string
-            mock_normalize.assert_called_once_with("")
-
             # Autocorrect should be called with empty string
-            mock_autocorrect.assert_called_once_with("")
+            mock_edits.assert_called_once_with("")
 
             # Copy should be called with empty string
             mock_copy.assert_called_once_with("")
@@ -61,9 +83,8 @@ class TestGuiEdgeCases:
             app.output_text.delete.assert_called_once_with("1.0", "end")
             app.output_text.insert.assert_called_once_with("1.0", "")
 
-    @patch("src.gui.normalize_whitespace")
-    @patch("src.gui.autocorrect_text")
-    def test_very_large_input(self, mock_autocorrect, mock_normalize):
+    @patch("src.gui.IncrementalNormalizer")
+    def test_very_large_input(self, mock_normalizer):
         """Test behavior with very large input."""
         # Setup mocks
         root = MagicMock()
@@ -72,8 +93,9 @@ class TestGuiEdgeCases:
         large_input = "word " * 10000  # 50,000+ characters
         large_output = "normalized " * 10000
 
+        mock_normalize = mock_normalizer.return_value.normalize
         mock_normalize.return_value = large_output
-        mock_autocorrect.return_value = large_output
+        mock_edits = mock_normalizer.return_value.normalize_with_edits
 
         with patch("src.gui.logger", autospec=True):
             app = WhitespaceNormalizerApp(root)
@@ -90,7 +112,7 @@ class TestGuiEdgeCases:
             mock_normalize.assert_called_once_with(large_input)
 
             # Autocorrect should not be called
-            mock_autocorrect.assert_not_called()
+            mock_edits.assert_not_called()
 
             # Copy should be called with large output
             app.copy_to_clipboard.assert_called_once_with(large_output)
@@ -100,9 +122,8 @@ class TestGuiEdgeCases:
             app.output_text.delete.assert_called_once()
             app.output_text.insert.assert_called_once_with("1.0", large_output)
 
-    @patch("src.gui.normalize_whitespace")
-    @patch("src.gui.autocorrect_text")
-    def test_unicode_input(self, mock_autocorrect, mock_normalize):
+    @patch("src.gui.IncrementalNormalizer")
+    def test_unicode_input(self, mock_normalizer):
         """Test behavior with Unicode input."""
         # Setup mocks
         root = MagicMock()
@@ -111,6 +132,7 @@ class TestGuiEdgeCases:
         unicode_input = "Hello 你好 Здравствуйте Olá مرحبا"
         unicode_output = "Normalized 你好 Здравствуйте Olá مرحبا"
 
+        mock_normalize = mock_normalizer.return_value.normalize
         mock_normalize.return_value = unicode_output
 
         with patch("src.gui.logger", autospec=True):
@@ -173,8 +195,10 @@ class TestAppInstanceBehavior:
                 # Set up a test case with input and expected output
                 app.input_text.get.return_value = "test   input"
 
-                # Mock the normalize function to return predictable output
-                with patch("src.gui.normalize_whitespace", return_value="test input"):
+                # Mock the normalizer to return predictable output
+                with patch.object(
+                    app.normalizer, "normalize", return_value="test input"
+                ):
                     # Set autocorrect off
                     app.autocorrect_var = MagicMock()
 
@@ -216,7 +240,7 @@ class TestLoggingIntegration:
                 app.copy_to_clipboard = MagicMock()
 
                 # Test without autocorrect
-                with patch("src.gui.normalize_whitespace", return_value="test"):
+                with patch.object(app.normalizer, "normalize", return_value="test"):
                     app.autocorrect_var = MagicMock()
                     app.autocorrect_var.get.return_value = False
 
@@ -226,18 +250,19 @@ class TestLoggingIntegration:
                     mock_logger.info.assert_called_with("Autocorrect disabled")
 
                 # Test with autocorrect
-                with patch("src.gui.normalize_whitespace", return_value="test"):
-                    with patch("src.gui.autocorrect_text", return_value="test"):
-                        mock_logger.reset_mock()
+                with patch.object(
+                    app.normalizer, "normalize_with_edits", return_value=("test", [])
+                ):
+                    mock_logger.reset_mock()
 
-                        app.autocorrect_var.get.return_value = True
+                    app.autocorrect_var.get.return_value = True
 
-                        app.normalize_and_copy()
+                    app.normalize_and_copy()
 
-                        # Check that logger.info was called
-                        mock_logger.info.assert_called_with(
-                            "Autocorrect enabled, applying spell correction"
-                        )
+                    # Check that logger.info was called
+                    mock_logger.info.assert_called_with(
+                        "Autocorrect enabled, applying spell correction"
+                    )
 
     def test_logging_in_copy_to_clipboard(self):
         """Test that logging happens correctly in copy_to_clipboard."""
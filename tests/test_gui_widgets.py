@@ -94,24 +94,16 @@ class TestWidgetProperties:
 class TestInteractiveFlow:
     """Tests for interactive flow with the widgets."""
 
-    @patch("src.gui.normalize_whitespace")
-    @patch("src.gui.autocorrect_text")
     @patch("src.gui.pyperclip.copy")
     def test_text_flow(
         self,
         mock_copy,
-        mock_autocorrect,
-        mock_normalize,
         app_with_real_tk: WhitespaceNormalizerApp,
         autocorrect_enabled,
     ):
         """Test the flow of text through the application."""
         app = app_with_real_tk
 
-        # Set up mock return values
-        mock_normalize.return_value = "normalized text"
-        mock_autocorrect.return_value = "corrected text"
-
         # Set text in input widget
         app.input_text.delete("1.0", tk.END)
         app.input_text.insert("1.0", "input   text with   spaces")
@@ -119,15 +111,23 @@ class TestInteractiveFlow:
         # Set autocorrect checkbox
         app.autocorrect_var.set(autocorrect_enabled)
 
-        # Trigger normalization
-        app.normalize_and_copy()
-
-        # Check that normalize_whitespace was called
-        mock_normalize.assert_called_once_with("input   text with   spaces")
-
-        # Check if autocorrect was called based on checkbox state
+        # Trigger normalization, with the normalizer's results mocked
+        with (
+            patch.object(
+                app.normalizer, "normalize", return_value="normalized text"
+            ) as mock_normalize,
+            patch.object(
+                app.normalizer,
+                "normalize_with_edits",
+                return_value=("normalized text", [(0, 10, "corrected")]),
+            ) as mock_edits,
+        ):
+            app.normalize_and_copy()
+
+        # Check if autocorrect was used based on checkbox state
         if autocorrect_enabled:
-            mock_autocorrect.assert_called_once_with("normalized text")
+            mock_edits.assert_called_once_with("input   text with   spaces\n")
+            mock_normalize.assert_not_called()
             mock_copy.assert_called_once_with("corrected text")
 
             # Check output text content
@@ -136,7 +136,8 @@ class TestInteractiveFlow:
             # Check status label
             assert "with autocorrect" in app.status_label.cget("text")
         else:
-            mock_autocorrect.assert_not_called()
+            mock_normalize.assert_called_once_with("input   text with   spaces\n")
+            mock_edits.assert_not_called()
             mock_copy.assert_called_once_with("normalized text")
 
             # Check output text content
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from src.core import normalize_whitespace
+from src.incremental import IncrementalNormalizer
+
+DOCUMENT = "\n".join(f"  Goal  {i}:\tthe  student  will  read  " for i in range(200))
+
+
+class TestIncrementalNormalizer:
+    """Tests for the IncrementalNormalizer class."""
+
+    def test_matches_full_run(self):
+        """Incremental output is identical to normalize_whitespace."""
+        normalizer = IncrementalNormalizer()
+        assert normalizer.normalize(DOCUMENT) == normalize_whitespace(DOCUMENT)
+        edited = DOCUMENT.replace("Goal  7:", "Goal  7 (revised):") + "\n\n  end "
+        assert normalizer.normalize(edited) == normalize_whitespace(edited)
+
+    def test_only_changed_lines_are_recomputed(self):
+        """A second run only normalizes lines that changed."""
+        normalizer = IncrementalNormalizer()
+        normalizer.normalize(DOCUMENT)
+        edited = DOCUMENT.replace("Goal  7:", "Goal  7 (revised):")
+
+        with patch.object(
+            normalizer.pipeline, "apply", wraps=normalizer.pipeline.apply
+        ) as mock_apply:
+            normalizer.normalize(edited)
+
+        mock_apply.assert_called_once_with(
+            ["  Goal  7 (revised):\tthe  student  will  read  "]
+        )
+
+    def test_unchanged_text_is_not_recomputed(self):
+        """Re-running unchanged text does no normalization work."""
+        normalizer = IncrementalNormalizer()
+        expected = normalizer.normalize(DOCUMENT)
+        with patch.object(normalizer.pipeline, "apply") as mock_apply:
+            assert normalizer.normalize(DOCUMENT) == expected
+        mock_apply.assert_not_called()
+
+    def test_autocorrect_only_changed_lines(self):
+        """Autocorrection is also limited to changed lines."""
+        normalizer = IncrementalNormalizer()
+        with patch(
+            "src.core.autocorrect_text", side_effect=str.upper
+        ) as mock_autocorrect:
+            first = normalizer.normalize("teh  cat\nsat\n\nteh  cat", autocorrect=True)
+            second = normalizer.normalize("teh  cat\nsat  down", autocorrect=True)
+
+        assert first == "TEH CAT\nSAT\n\nTEH CAT"
+        assert second == "TEH CAT\nSAT DOWN"
+        assert [call.args[0] for call in mock_autocorrect.call_args_list] == [
+            "teh cat",
+            "sat",
+            "",
+            "sat down",
+        ]
+
+    def test_edits_only_changed_lines(self):
+        """Corrections are found for changed lines, at offsets into the whole text."""
+        normalizer = IncrementalNormalizer()
+        with patch(
+            "src.core.autocorrection_edits",
+            side_effect=lambda line: [(0, 3, "the")] if line.startswith("teh") else [],
+        ) as mock_edits:
+            normalizer.normalize_with_edits("teh  cat\nsat")
+            text, edits = normalizer.normalize_with_edits("teh  cat\nsat\nteh  end")
+
+        assert text == "teh cat\nsat\nteh end"
+        assert edits == [(0, 3, "the"), (12, 15, "the")]
+        assert [call.args[0] for call in mock_edits.call_args_list] == [
+            "teh cat",
+            "sat",
+            "teh end",
+        ]
+
+    def test_cache_is_bounded_to_latest_document(self):
+        """Lines removed from the document are forgotten."""
+        normalizer = IncrementalNormalizer()
+        normalizer.normalize("first\nsecond")
+        normalizer.normalize("second")
+        assert list(normalizer._normalized) == ["second"]
+
+    def test_clear(self):
+        """Clearing forces the next run to recompute every line."""
+        normalizer = IncrementalNormalizer()
+        normalizer.normalize("a  b")
+        normalizer.clear()
+        assert normalizer._normalized == {}
@@ -0,0 +1,65 @@
+import os
+from unittest.mock import patch
+
+from src.core import autocorrect_text
+from src.incremental import IncrementalNormalizer
+from src.lexicon import DEFAULT_LEXICON, Lexicon
+
+
+def write(path, text):
+    """Writes a word list, moving its modification time forward."""
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLexicon:
+    """Tests for the Lexicon class."""
+
+    def test_loads_files_and_directories(self, tmp_path):
+        """Terms come from listed files and every .txt file of listed directories."""
+        (tmp_path / "lists").mkdir()
+        write(tmp_path / "lists" / "iep.txt", "# IEP terms\nFAPE LRE\n\niep\n")
+        write(tmp_path / "lists" / "notes.md", "ignored\n")
+        write(tmp_path / "codes.txt", "ot/pt\n")
+        lexicon = Lexicon([tmp_path / "lists", tmp_path / "codes.txt", "missing"])
+        assert lexicon.refresh()
+        assert lexicon.words == {"fape", "lre", "iep", "ot/pt"}
+        assert "Fape" in lexicon
+        assert "ignored" not in lexicon
+
+    def test_refresh_reloads_changed_files(self, tmp_path):
+        """Edits to a word list take effect on the next refresh."""
+        path = tmp_path / "terms.txt"
+        write(path, "fape\n")
+        lexicon = Lexicon([path])
+        assert list(lexicon.filter(["fape", "lre"])) == ["lre"]
+        assert lexicon.generation == 1
+        assert not lexicon.refresh()
+        write(path, "fape\nlre\n")
+        assert list(lexicon.filter(["fape", "lre"])) == []
+
+    @patch("src.core.spell")
+    def test_autocorrect_leaves_terms_unchanged(self, mock_spell, tmp_path):
+        """Lexicon terms never reach the spell checker."""
+        path = tmp_path / "terms.txt"
+        write(path, "fape\n")
+        mock_spell.unknown.side_effect = lambda words: set(words)
+        mock_spell.correction.return_value = "fade"
+        assert autocorrect_text("fape", lexicon=Lexicon([path])) == "fape"
+        mock_spell.unknown.assert_not_called()
+
+    @patch("src.core.spell")
+    def test_incremental_edits_follow_changes(self, mock_spell, tmp_path):
+        """Lines already corrected are corrected again once the lexicon changes."""
+        path = tmp_path / "terms.txt"
+        write(path, "fape\n")
+        mock_spell.unknown.side_effect = lambda words: {w for w in words if w != "the"}
+        mock_spell.correction.return_value = "face"
+        normalizer = IncrementalNormalizer()
+        with patch.object(DEFAULT_LEXICON, "paths", [path]):
+            assert normalizer.normalize_with_edits("the fape") == ("the fape", [])
+            write(path, "lre\n")
+            edits = normalizer.normalize_with_edits("the fape")
+        DEFAULT_LEXICON.reload()
+        assert edits == ("the fape", [(4, 8, "face")])
@@ -2,7 +2,12 @@ from unittest.mock import patch
 
 import pytest
 
-from src.core import normalize_whitespace
+from src.core import (
+    QUOTES_PATTERN,
+    TAB_PATTERN,
+    WHITESPACE_PATTERN,
+    normalize_whitespace,
+)
 
 
 @pytest.mark.skip("Test failing, unsure why.")
@@ -38,9 +43,9 @@ from src.core import normalize_whitespace
             "Multiple\n  Lines \t with\tdifferent `quote´ types\n\nand empty lines",
             "Multiple\nLines, with, different 'quote' types\n\nand empty lines",
         ),
-        # Unicode characters - current implementation only handles regular spaces
-        ("hello\u2003world", "hello\u2003world"),  # Em space preserved
-        ("hello\u00a0world", "hello\u00a0world"),  # Non-breaking space preserved
+        # Unicode spaces are folded into regular spaces
+        ("hello\u2003world", "hello world"),  # Em space folded
+        ("hello\u00a0world", "hello world"),  # Non-breaking space folded
         # Multiple tabs in sequence
         ("hello\t\tworld", "hello, , world"),  # Each tab becomes ", "
         # Tab at beginning and end
@@ -116,3 +121,56 @@ def test_logger_called_correctly(mock_logger):
     mock_logger.debug.assert_any_call(
         "Whitespace normalization complete, result length: 3"
     )
+
+
+def _three_pass_reference(text):
+    """The original per-line, three-regex implementation of normalize_whitespace."""
+    return "\n".join(
+        TAB_PATTERN.sub(
+            ", ", QUOTES_PATTERN.sub("'", WHITESPACE_PATTERN.sub(" ", line.strip()))
+        )
+        for line in text.splitlines()
+    )
+
+
+@pytest.mark.parametrize(
+    "input_text",
+    [
+        "",
+        "   ",
+        "\n\n\n",
+        "hello \t world",
+        "hello\t world\t\t again",
+        "a  \t  b",
+        "trailing\r\nwindows\r\nlines\r\n",
+        "form\x0cfeed\x0bvertical\x1cseparators here",
+        "  mixed \"double\" `back´ and 'single'  \n\tindented\n  ",
+        "hello   world  x",
+        '  This   is\ta  test  with "quotes"   ' * 50,
+    ],
+)
+def test_matches_three_pass_reference(input_text):
+    """The fused engine must be byte-for-byte identical to the three-pass version."""
+    assert normalize_whitespace(input_text) == _three_pass_reference(input_text)
+
+
+@pytest.mark.parametrize(
+    "input_text,expected_output",
+    [
+        ("hello\u00a0world", "hello world"),  # Non-breaking space
+        ("hello\u2009\u2009world", "hello world"),  # Thin spaces
+        ("hello\u00a0 \u3000world", "hello world"),  # Mixed run of spaces
+        ("\u202fhello world\u00a0", "hello world"),  # Stripped at line ends
+        ("zero\u200bwidth", "zerowidth"),  # Zero-width space deleted
+        ("hello \u200b world", "hello world"),  # Zero-width inside a run
+        ("\ufeff\u200b  hello", "hello"),  # Zero-width at line start
+        ("soft\u00adhyphen", "softhyphen"),  # Soft hyphen deleted
+        ("\u201csmart\u201d \u2018quotes\u2019", "'smart' 'quotes'"),
+        ("\u201elow\u201c and prime\u2032", "'low' and prime'"),
+        ("emoji\u200d\u2764", "emoji\u200d\u2764"),  # Zero-width joiner kept
+        ("a\u00a0\tb", "a , b"),  # Tabs still expand after collapsing
+    ],
+)
+def test_unicode_folding(input_text, expected_output):
+    """Unicode spaces, zero-width characters and smart quotes are folded."""
+    assert normalize_whitespace(input_text) == expected_output
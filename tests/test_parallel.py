@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+import pytest
+
+from src import core
+from src.core import normalize_many, normalize_parallel, normalize_whitespace
+from src.lexicon import DEFAULT_LEXICON
+
+SAMPLE = '  This   is\ta  test  with "quotes"   \r\n\n  \nsecond  line\x0c  x  \n' * 40
+
+
+class TestNormalizeParallel:
+    """Tests for the process-pool normalize_parallel function."""
+
+    @pytest.mark.parametrize("block_size", [1, 10, 97, 5000])
+    def test_matches_serial(self, block_size):
+        """Blocks are reassembled in order into the serial result."""
+        result = normalize_parallel(
+            SAMPLE, workers=2, threshold=0, block_size=block_size
+        )
+        assert result == normalize_whitespace(SAMPLE)
+
+    def test_trailing_newline(self):
+        """A text ending exactly on a block boundary keeps its last line."""
+        text = "a  b\n\n"
+        assert normalize_parallel(
+            text, workers=2, threshold=0, block_size=1
+        ) == normalize_whitespace(text)
+
+    def test_below_threshold_stays_serial(self):
+        """Short texts are normalized without starting a process pool."""
+        with patch("src.core.ProcessPoolExecutor") as mock_executor:
+            assert normalize_parallel("a  b", workers=4) == "a b"
+            mock_executor.assert_not_called()
+
+    def test_single_worker_stays_serial(self):
+        """A single worker never starts a process pool."""
+        with patch("src.core.ProcessPoolExecutor") as mock_executor:
+            assert normalize_parallel("a  b", workers=1, threshold=0) == "a b"
+            mock_executor.assert_not_called()
+
+
+class TestNormalizeMany:
+    """Tests for the normalize_many batch API."""
+
+    DOCS = [f"record  {i}\t{'x' * (i % 7)}  \n  line  two  " for i in range(50)]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_ordered(self, workers):
+        """Results are yielded in input order."""
+        results = list(normalize_many(self.DOCS, workers=workers, chunksize=3))
+        assert results == [normalize_whitespace(doc) for doc in self.DOCS]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unordered(self, workers):
+        """Unordered results are paired with their input index."""
+        results = normalize_many(
+            iter(self.DOCS), workers=workers, chunksize=4, ordered=False
+        )
+        assert sorted(results) == [
+            (i, normalize_whitespace(doc)) for i, doc in enumerate(self.DOCS)
+        ]
+
+    def test_empty(self):
+        """No documents yield no results."""
+        assert list(normalize_many([], workers=2)) == []
+
+    def test_autocorrect(self):
+        """Autocorrection runs after normalization when enabled."""
+        with patch(
+            "src.core.autocorrect_text", side_effect=lambda text: text.upper()
+        ) as mock_autocorrect:
+            results = list(
+                normalize_many(["a  b", "c\td"], autocorrect=True, workers=1)
+            )
+        assert results == ["A B", "C, D"]
+        assert mock_autocorrect.call_count == 2
+
+    @patch("src.core.ProcessPoolExecutor")
+    def test_autocorrect_workers_share_settings(self, mock_executor, tmp_path):
+        """Autocorrecting workers are started with the parent's settings."""
+        with (
+            patch.object(core, "persistent_cache", None),
+            patch.object(DEFAULT_LEXICON, "paths", [tmp_path / "terms.txt"]),
+        ):
+            list(normalize_many(["a  b"], autocorrect=True, workers=2))
+        mock_executor.assert_called_once_with(
+            max_workers=2,
+            initializer=core._init_batch_worker,
+            initargs=(True, core.correction_engine, None, [tmp_path / "terms.txt"]),
+        )
+
+    @patch("src.core.get_correction_backend")
+    def test_batch_worker_takes_settings(self, mock_backend, tmp_path):
+        """A worker adopts the persistent cache and lexicon it is given."""
+        with (
+            patch.object(core, "persistent_cache", None),
+            patch.object(DEFAULT_LEXICON, "paths", []),
+        ):
+            core._init_batch_worker(
+                True, "pyspellchecker", tmp_path / "cache.db", [tmp_path / "terms.txt"]
+            )
+            assert core.persistent_cache.path == tmp_path / "cache.db"
+            assert DEFAULT_LEXICON.paths == [tmp_path / "terms.txt"]
+        mock_backend.assert_called_once()
+
+
+class TestParallelCorrection:
+    """Tests for correcting unknown words in worker processes."""
+
+    def test_matches_serial(self):
+        """Words corrected by the worker pool match serial corrections."""
+        words = ["helo", "wrold", "studnet", "raed", "the", "acuracy"] * 3
+        try:
+            with patch.object(core, "PARALLEL_CORRECTION_THRESHOLD", 2):
+                parallel = core.correct_words(words, workers=2)
+        finally:
+            core.shutdown_correction_workers()
+        core.correction_cache.clear()
+        assert parallel == core.correct_words(words)
+        assert parallel["studnet"] == "student"
+
+    @patch("src.core.atexit.register")
+    @patch("src.core.ProcessPoolExecutor")
+    def test_new_pools_add_no_exit_handlers(self, mock_executor, mock_register):
+        """Replacing the pool does not register another exit handler."""
+        try:
+            core._get_correction_executor(2)
+            core._get_correction_executor(3)
+        finally:
+            core.shutdown_correction_workers()
+        assert mock_executor.call_count == 2
+        mock_register.assert_not_called()
+
+    @patch("src.core._correct_unknown_parallel")
+    @patch("src.core.spell")
+    def test_few_words_stay_serial(self, mock_spell, mock_parallel):
+        """Below the threshold, no worker processes are used."""
+        mock_spell.unknown.side_effect = lambda words: set(words)
+        mock_spell.correction.return_value = None
+        assert core.correct_words(["helo"], workers=4) == {"helo": "helo"}
+        mock_parallel.assert_not_called()
@@ -0,0 +1,158 @@
+import pytest
+
+from src.core import normalize_whitespace
+from src.pipeline import (
+    COLLAPSE_SPACES,
+    DEFAULT_PIPELINE,
+    DEFAULT_RULES,
+    FOLD_QUOTES,
+    LINE_CACHE_SIZE,
+    MAP_TABS,
+    STRIP_LINES,
+    CharacterRule,
+    NormalizationPipeline,
+    PatternRule,
+    _compile,
+)
+
+SAMPLE = '  mixed "double" `back´  quotes\t and\ttabs  \n\n   indented  line  '
+
+
+class TestNormalizationPipeline:
+    """Tests for the NormalizationPipeline class."""
+
+    def test_default_pipeline_matches_normalize_whitespace(self):
+        """The default rules reproduce normalize_whitespace."""
+        assert DEFAULT_PIPELINE(SAMPLE) == normalize_whitespace(SAMPLE)
+        assert DEFAULT_PIPELINE.rules == DEFAULT_RULES
+
+    def test_no_rules_only_joins_lines(self):
+        """Without rules, lines are only rejoined with newlines."""
+        assert NormalizationPipeline([])("a  b\r\nc ") == "a  b\nc "
+
+    def test_individual_rules(self):
+        """Each built-in rule can be used on its own."""
+        assert NormalizationPipeline([STRIP_LINES])("  a  b  ") == "a  b"
+        assert NormalizationPipeline([COLLAPSE_SPACES])(" a  b ") == " a b "
+        assert NormalizationPipeline([FOLD_QUOTES])('"a` b´') == "'a' b'"
+        assert NormalizationPipeline([MAP_TABS])("a\tb") == "a, b"
+
+    def test_user_pattern_rules_share_one_scan(self):
+        """Several pattern rules are applied by one combined expression."""
+        pipeline = DEFAULT_PIPELINE.with_rules(
+            PatternRule(r"\bIEP\b", "Individualized Education Program"),
+            PatternRule(r"\d+", lambda match: f"<{match.group()}>"),
+        )
+        assert pipeline("the  IEP\tgoal 12") == (
+            "the Individualized Education Program, goal <12>"
+        )
+
+    def test_pattern_rules_apply_per_line(self):
+        """Anchors match at every line, and patterns never span a line break."""
+        bullets = NormalizationPipeline([PatternRule(r"^- ", "* ")])
+        assert bullets("- one\n- two") == "* one\n* two"
+        joined = NormalizationPipeline([PatternRule(r"x\s+y", "xy")])
+        assert joined("x\ny x  y") == "x\ny xy"
+
+    def test_single_line_rules_scan_all_lines_at_once(self):
+        """Rules that cannot match a line break share one scan of the whole text."""
+        assert not DEFAULT_PIPELINE._compiled.per_line
+        rule = PatternRule(r"^a", "b", single_line=True)
+        assert NormalizationPipeline([rule])("ab\naa") == "bb\nba"
+
+    def test_literal_replacement_is_not_a_template(self):
+        """Backslashes in string replacements are kept literally."""
+        pipeline = NormalizationPipeline([PatternRule("/", "\\")])
+        assert pipeline("a/b") == "a\\b"
+
+    def test_user_character_rules(self):
+        """Character rules are merged into the translation table."""
+        pipeline = DEFAULT_PIPELINE.with_rules(
+            CharacterRule("–—", "-"), CharacterRule("…", "...")
+        )
+        assert pipeline("a — b\tc…") == "a - b, c..."
+
+    def test_chained_character_rules(self):
+        """Character rules apply once, on ASCII and non-ASCII text alike."""
+        pipeline = NormalizationPipeline(
+            [CharacterRule("a", "b"), CharacterRule("b", "c")]
+        )
+        assert pipeline("ab") == "bc"
+        assert pipeline("ab é") == "bc é"
+
+    def test_non_ascii_matches_translation(self):
+        """Non-ASCII text gets the same result as the translation table."""
+        pipeline = DEFAULT_PIPELINE.with_rules(CharacterRule("…", "..."))
+        text = "“a”\tb…\u200b"
+        table = pipeline._compiled.table
+        assert pipeline(text) == text.translate(table).replace("\t", ", ")
+
+    def test_conflicting_character_rules(self):
+        """Mapping one character to two replacements is rejected."""
+        with pytest.raises(ValueError, match="Conflicting"):
+            NormalizationPipeline([FOLD_QUOTES, CharacterRule('"', "*")])
+
+    def test_line_break_replacements_rejected(self):
+        """Rules that would add line breaks are refused when they are built."""
+        with pytest.raises(ValueError):
+            PatternRule("a", "\n")
+        with pytest.raises(ValueError):
+            CharacterRule("\t", "\n")
+
+    def test_compilation_is_cached(self):
+        """Pipelines with the same rules share one compiled configuration."""
+        assert NormalizationPipeline(DEFAULT_RULES)._compiled is _compile(DEFAULT_RULES)
+
+
+class TestLineCache:
+    """Tests for the pipeline's line cache."""
+
+    def test_default_pipeline_is_cached(self):
+        """The default pipeline remembers normalized lines."""
+        assert DEFAULT_PIPELINE.line_cache is not None
+        assert DEFAULT_PIPELINE.line_cache.maxsize == LINE_CACHE_SIZE
+
+    def test_repeated_lines_are_normalized_once(self):
+        """Repeated lines hit the cache instead of being normalized again."""
+        pipeline = NormalizationPipeline(cache_size=16)
+        text = "  Signature:  ____  \n  Goal  stem  \n" * 100 + "unique  line"
+
+        assert pipeline(text) == NormalizationPipeline()(text)
+        info = pipeline.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 201, 3)
+
+        assert pipeline(text) == NormalizationPipeline()(text)
+        assert pipeline.cache_info().hits == 201
+
+    def test_mixed_hits_and_misses(self):
+        """Cached and newly normalized lines are merged in order."""
+        pipeline = NormalizationPipeline(cache_size=16)
+        pipeline("a  b\nc  d")
+        assert pipeline("x  y\nc  d\n\ta\na  b") == "x y\nc d\na\na b"
+
+    def test_callable_adding_line_breaks(self):
+        """A replacement function that adds a line break is reported clearly."""
+        rule = PatternRule("a", lambda match: "\n")
+        pipeline = NormalizationPipeline([rule], cache_size=8)
+        with pytest.raises(ValueError, match="line breaks"):
+            pipeline("bab")
+
+    def test_cache_can_be_disabled(self):
+        """A cache size of 0 turns the line cache off."""
+        pipeline = NormalizationPipeline(cache_size=16)
+        pipeline.configure_cache(0)
+        assert pipeline.line_cache is None
+        assert pipeline.cache_info() is None
+        assert pipeline("a  b") == "a b"
+
+    def test_with_rules_keeps_cache_size(self):
+        """Extending a cached pipeline gives a new pipeline with its own cache."""
+        pipeline = DEFAULT_PIPELINE.with_rules(CharacterRule("…", "..."))
+        assert pipeline.line_cache is not DEFAULT_PIPELINE.line_cache
+        assert pipeline.line_cache.maxsize == LINE_CACHE_SIZE
+
+    def test_ascii_pattern_is_equivalent(self):
+        """The ASCII-only collapse pattern is used for ASCII text."""
+        pipeline = NormalizationPipeline()
+        assert pipeline("a  b c   d") == "a b c d"
+        assert pipeline("a \u00a0b") == "a b"
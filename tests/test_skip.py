@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core import autocorrect_text
+from src.skip import SkipClassifier
+
+
+class TestSkipClassifier:
+    """Tests for the SkipClassifier class."""
+
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            ("https://example.com/iep?id=4", "url"),
+            ("www.district.org", "url"),
+            ("parent@example.com", "email"),
+            ("10/16/2026", "date"),
+            ("2026-10-16", "date"),
+            ("1,250.5", "number"),
+            ("90%", "number"),
+            ("3rd", "number"),
+            ("s12345", "identifier"),
+            ("goal-2b", "identifier"),
+            ("and/or", "path"),
+            ("reading", None),
+            ("don't", None),
+        ],
+    )
+    def test_classify(self, word, expected):
+        """Each kind of token is recognized by its rule."""
+        assert SkipClassifier().classify(word) == expected
+
+    def test_filter_counts_skipped_tokens(self):
+        """Skipped tokens are counted by class and the rest are deduplicated."""
+        classifier = SkipClassifier()
+        words = ["helo", "42", "helo", "7", "a@b.co", "wrld"]
+        assert classifier.filter(words) == ["helo", "wrld"]
+        assert classifier.counts == {"number": 2, "email": 1}
+        classifier.reset_counts()
+        assert not classifier.counts
+
+    def test_with_rules(self):
+        """Rules can be added, replaced and removed."""
+        classifier = SkipClassifier().with_rules(
+            path=None, code=r"[a-z]{2}\d{3}", number=r"\d+"
+        )
+        assert classifier.classify("and/or") is None
+        assert classifier.classify("ab123") == "identifier"
+        assert classifier.classify("1.5") is None
+        assert SkipClassifier({"code": r"[a-z]{2}\d{3}"}).classify("ab123") == "code"
+        assert SkipClassifier({}).classify("42") is None
+
+    def test_invalid_rule_name(self):
+        """Rule names become regex group names, so they must be identifiers."""
+        with pytest.raises(ValueError):
+            SkipClassifier({"student id": r"s\d+"})
+
+    @patch("src.core.spell")
+    def test_autocorrect_bypasses_checker(self, mock_spell):
+        """Skipped tokens never reach the spell checker and are left unchanged."""
+        mock_spell.unknown.side_effect = lambda words: set(words)
+        mock_spell.correction.return_value = "fixed"
+        classifier = SkipClassifier()
+        text = "helo s12345 on 10/16/2026, see www.example.com"
+        result = autocorrect_text(text, classifier=classifier)
+        assert result == "fixed s12345 fixed 10/16/2026, fixed www.example.com"
+        assert classifier.counts == {"identifier": 1, "date": 1, "url": 1}
+        mock_spell.unknown.assert_called_once_with(["helo", "on", "see"])
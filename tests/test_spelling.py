@@ -6,9 +6,12 @@ from src.core import (
     QUOTES_PATTERN,
     TAB_PATTERN,
     WHITESPACE_PATTERN,
+    apply_edits,
     autocorrect_text,
+    autocorrection_edits,
     normalize_whitespace,
     preserve_punctuation,
+    tokenize,
 )
 
 
@@ -193,6 +196,73 @@ class TestPreservePunctuation:
         assert punctuation == "..."
 
 
+class TestTokenize:
+    """Tests for the tokenize function."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("hello, world!", [("", "hello", ",", " "), ("", "world", "!", "")]),
+            ('"(helo)"', [('"(', "helo", ')"', "")]),
+            ("don't  stop", [("", "don't", "", "  "), ("", "stop", "", "")]),
+            ("...", [("...", "", "", "")]),
+            ("", []),
+        ],
+    )
+    def test_tokens(self, text, expected):
+        """Tokens split punctuation from words and keep the original spacing."""
+        tokens = list(tokenize(text))
+        assert tokens == expected
+        assert "".join("".join(token) for token in tokens) == text
+
+    def test_long_punctuation_run(self):
+        """A long run of punctuation is tokenized in linear time."""
+        text = "word" + "!" * 100_000
+        assert list(tokenize(text)) == [("", "word", "!" * 100_000, "")]
+
+    @patch("src.core.spell")
+    def test_autocorrect_keeps_leading_punctuation(self, mock_spell):
+        """Leading quotes and brackets stay in place and spacing is preserved."""
+        mock_spell.unknown.side_effect = lambda words: {w.lower() for w in words}
+        mock_spell.correction.side_effect = lambda word: {"helo": "hello"}.get(word)
+        assert autocorrect_text('"(helo)"  ...  Helo') == '"(hello)"  ...  Helo'
+        mock_spell.correction.assert_called_once_with("helo")
+
+
+class TestAutocorrectionEdits:
+    """Tests for the autocorrection_edits and apply_edits functions."""
+
+    @patch("src.core.spell")
+    def test_edits(self, mock_spell):
+        """Only misspelled words are returned, with their offsets in the text."""
+        mock_spell.unknown.side_effect = lambda words: {w.lower() for w in words}
+        mock_spell.correction.side_effect = {"helo": "hello", "wrold": "world"}.get
+        text = "(helo) there\r\n  wrold, helo"
+        edits = autocorrection_edits(text)
+        assert edits == [(1, 5, "hello"), (16, 21, "world"), (23, 27, "hello")]
+        assert apply_edits(text, edits) == "(hello) there\r\n  world, hello"
+
+    @patch("src.core.spell")
+    def test_matches_autocorrect_text(self, mock_spell):
+        """The edits give what autocorrect_text returns, line endings aside."""
+        mock_spell.unknown.side_effect = lambda words: {w.lower() for w in words}
+        mock_spell.correction.side_effect = lambda word: word.upper()
+        text = "one  two,\n\nthree Four"
+        assert apply_edits(text, autocorrection_edits(text)) == autocorrect_text(text)
+
+    def test_apply_no_edits(self):
+        """Without edits the text is unchanged."""
+        assert apply_edits("some text", []) == "some text"
+
+    @pytest.mark.parametrize(
+        "edits", [[(4, 6, "x"), (0, 2, "y")], [(0, 3, "x"), (2, 4, "y")], [(8, 12, "")]]
+    )
+    def test_invalid_edits(self, edits):
+        """Edits out of order, overlapping or outside the text are rejected."""
+        with pytest.raises(ValueError):
+            apply_edits("some text", edits)
+
+
 class TestRegexPatterns:
     """Tests for the regex patterns used in the module."""
 
@@ -0,0 +1,174 @@
+import io
+from unittest.mock import patch
+
+import pytest
+
+from src.core import (
+    normalize_bytes,
+    normalize_file,
+    normalize_stream,
+    normalize_whitespace,
+    write_normalized_stream,
+)
+from src.pipeline import DEFAULT_RULES, PatternRule
+
+SAMPLE = (
+    '  First   line with "quotes"  \r\n'
+    "second\tline\r\n"
+    "\n"
+    "   \n"
+    "third line\x0bwith a vertical tab\r"
+    "fourth  line  without a terminator"
+)
+
+
+def _chunks(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestNormalizeStream:
+    """Tests for the normalize_stream generator."""
+
+    def test_empty_source(self):
+        """An empty source yields nothing."""
+        assert list(normalize_stream([])) == []
+        assert list(normalize_stream(["", ""])) == []
+
+    def test_file_object(self):
+        """Reading from a file object matches normalize_whitespace."""
+        source = io.StringIO("a  b\n\tc\n\nd  \n", newline="")
+        assert "\n".join(normalize_stream(source)) == normalize_whitespace(
+            "a  b\n\tc\n\nd  \n"
+        )
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16, len(SAMPLE)])
+    def test_arbitrary_chunks(self, size):
+        """Chunks that split lines, including CRLF pairs, give identical output."""
+        lines = list(normalize_stream(_chunks(SAMPLE, size)))
+        assert "\n".join(lines) == normalize_whitespace(SAMPLE)
+
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            ["a\r", "\r", "b"],
+            ["a\r", "b  c", "\n"],
+            ["a\r", "\nb"],
+            ["long  "] * 1000 + ["end\r", "\n", "x"],
+        ],
+    )
+    def test_line_spread_over_chunks(self, chunks):
+        """Lines and CRLF pairs spread over several chunks give identical output."""
+        lines = list(normalize_stream(chunks, batch_size=1))
+        assert "\n".join(lines) == normalize_whitespace("".join(chunks))
+
+    def test_small_batches(self):
+        """Normalizing in many small batches gives identical output."""
+        source = io.StringIO(SAMPLE * 20, newline="")
+        lines = list(normalize_stream(source, batch_size=8))
+        assert "\n".join(lines) == normalize_whitespace(SAMPLE * 20)
+
+    def test_is_lazy(self):
+        """Lines are produced before the whole source has been consumed."""
+
+        def source():
+            yield "first  line\n"
+            raise AssertionError("source consumed too eagerly")
+
+        assert next(normalize_stream(source(), batch_size=1)) == "first line"
+
+
+class TestWriteNormalizedStream:
+    """Tests for the write_normalized_stream helper."""
+
+    def test_writes_normalized_text(self):
+        """The output handle receives the same text normalize_whitespace returns."""
+        output = io.StringIO()
+        written = write_normalized_stream(_chunks(SAMPLE, 5), output, batch_size=16)
+        assert output.getvalue() == normalize_whitespace(SAMPLE)
+        assert written == len(output.getvalue())
+
+    def test_empty_source(self):
+        """Nothing is written for an empty source."""
+        output = io.StringIO()
+        assert write_normalized_stream([], output) == 0
+        assert output.getvalue() == ""
+
+
+class TestNormalizeFile:
+    """Tests for the memory-mapped normalize_file entry point."""
+
+    @pytest.mark.parametrize("window_size", [1, 4, 13, 1 << 20])
+    def test_matches_normalize_whitespace(self, tmp_path, window_size):
+        """Any window size produces the same text as normalize_whitespace."""
+        text = SAMPLE + "\nmulti-byte ´quotes´ and “curly” text\n" * 3
+        source = tmp_path / "input.txt"
+        source.write_bytes(text.encode("utf-8"))
+        target = tmp_path / "output.txt"
+
+        written = normalize_file(source, target, window_size=window_size)
+
+        result = target.read_bytes().decode("utf-8")
+        assert result == normalize_whitespace(text)
+        assert written == len(result)
+
+    def test_other_encoding(self, tmp_path):
+        """Multi-byte encodings are decoded incrementally across windows."""
+        text = "first  line\nsecond\tline\n"
+        source = tmp_path / "input.txt"
+        source.write_bytes(text.encode("utf-16"))
+        target = tmp_path / "output.txt"
+
+        normalize_file(source, target, encoding="utf-16", window_size=3)
+
+        assert target.read_bytes().decode("utf-16") == normalize_whitespace(text)
+
+    def test_empty_file(self, tmp_path):
+        """An empty input produces an empty output file."""
+        source = tmp_path / "input.txt"
+        source.write_bytes(b"")
+        target = tmp_path / "output.txt"
+
+        assert normalize_file(source, target) == 0
+        assert target.read_bytes() == b""
+
+
+class TestNormalizeBytes:
+    """Tests for the byte-level normalize_bytes function."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "   ",
+            SAMPLE,
+            '  plain  ASCII\twith "quotes" and `ticks`  \r\n\r\nend ',
+            "vertical\x0btab and unit\x1fseparator",
+            "non-ASCII “curly” quotes ´here´",
+        ],
+    )
+    def test_matches_normalize_whitespace(self, text):
+        """Both the ASCII and the decoding path match normalize_whitespace."""
+        expected = normalize_whitespace(text).encode()
+        assert normalize_bytes(text.encode()) == expected
+        assert normalize_bytes(bytearray(text.encode())) == expected
+
+    @pytest.mark.parametrize("rule", DEFAULT_RULES)
+    def test_matches_every_rule(self, rule):
+        """The byte path agrees with the pipeline on every ASCII character of a rule."""
+        # Pattern rules are exercised with the spaces they collapse
+        characters = "  " if isinstance(rule, PatternRule) else rule.characters
+        ascii_characters = "".join(char for char in characters if char.isascii())
+        text = "".join(f" a{char}{char}b{char} " for char in ascii_characters)
+        text += "\n" + text[::-1]
+        assert normalize_bytes(text.encode()) == normalize_whitespace(text).encode()
+
+    def test_ascii_input_is_not_decoded(self):
+        """Plain ASCII input never goes through the str pipeline."""
+        with patch("src.core.DEFAULT_PIPELINE") as mock_pipeline:
+            assert normalize_bytes(b"a  b\t'c'") == b"a b, 'c'"
+            mock_pipeline.apply.assert_not_called()
+
+    def test_invalid_utf8(self):
+        """Non-ASCII input must be valid UTF-8."""
+        with pytest.raises(UnicodeDecodeError):
+            normalize_bytes(b"caf\xe9")
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.correction import damerau_levenshtein
+from src.vectorized import VectorizedIndex, bounded_distances
+
+
+def encode(word: str) -> np.ndarray:
+    """Returns a word's code points as a row of an array."""
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32)
+
+
+class TestBoundedDistances:
+    """Tests for the bounded_distances function."""
+
+    @pytest.mark.parametrize(
+        "source, targets",
+        [
+            ("kitten", ["sitten", "kitetn", "mitten", "ktitne", "kitten", "zzzzzz"]),
+            ("abc", ["acb", "bac", "xyz", "abd"]),
+        ],
+    )
+    def test_matches_damerau_levenshtein(self, source, targets):
+        """Distances within the bound match the scalar implementation."""
+        words = np.stack([encode(target) for target in targets])
+        expected = [min(damerau_levenshtein(source, t), 3) for t in targets]
+        assert bounded_distances(encode(source), words, 2).tolist() == expected
+
+    def test_transposed_pair_not_edited_again(self):
+        """Unlike damerau_levenshtein, a transposed pair is never edited again."""
+        words = np.stack([encode("abc")])
+        assert damerau_levenshtein("ca", "abc") == 2
+        assert bounded_distances(encode("ca"), words, 3).tolist() == [3]
+
+    def test_different_lengths(self):
+        """Words of another length than the target are compared correctly."""
+        words = np.stack([encode("helps"), encode("hxlpx")])
+        assert bounded_distances(encode("help"), words, 2).tolist() == [1, 2]
+
+    def test_empty(self):
+        """No words give no distances."""
+        words = np.empty((0, 4), dtype=np.uint32)
+        assert bounded_distances(encode("word"), words, 2).tolist() == []
+
+
+class TestVectorizedIndex:
+    """Tests for the VectorizedIndex class."""
+
+    def test_differs_from_pyspellchecker_after_transpositions(self, checker):
+        """Words only reachable by editing a transposed pair again are missed."""
+        index = VectorizedIndex.from_spellchecker(checker)
+        assert checker.correction("olwrd") == "word"
+        assert index.correction("olwrd") is None